@@ -0,0 +1,18 @@
+-- Filter-acceleration columns for the gold table read directly by the
+-- pit-stop tool (the other tools read the materialized views, which
+-- project their own *_lower columns).
+--
+-- The generated columns keep the lowered names in the data files, so a
+-- LIKE against them skips the per-row LOWER() call and lets Delta data
+-- skipping prune row groups; the ZORDER clusters the files by the
+-- filter columns. Run once after the gold build, re-OPTIMIZE after
+-- large rewrites.
+
+ALTER TABLE f1.f1_gold_race_driver_features
+    ADD COLUMN driverName_lower STRING GENERATED ALWAYS AS (LOWER(driverName));
+
+ALTER TABLE f1.f1_gold_race_driver_features
+    ADD COLUMN teamName_lower STRING GENERATED ALWAYS AS (LOWER(teamName));
+
+OPTIMIZE f1.f1_gold_race_driver_features
+    ZORDER BY (season, driverName_lower, teamName_lower);
@@ -0,0 +1,72 @@
+-- Materialized views backing the hot MCP tool queries.
+--
+-- The sql_tools read the gold tables with a fixed ORDER BY ... LIMIT
+-- shape on every call; materializing those shapes lets the warehouse
+-- serve pre-aggregated, pre-sorted rows instead of re-scanning and
+-- re-sorting the gold tables per invocation.
+--
+-- The *_lower columns let the name filters match without a per-row
+-- LOWER() call and participate in data skipping (see
+-- gold_indexes.sql for the gold-table equivalents).
+--
+-- Run once against the warehouse after the gold layer exists, and
+-- schedule the REFRESH statements to follow the silver->gold job
+-- (03_f1_build_gold) so the views track new seasons.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS f1.mv_driver_season_stats_ranked AS
+SELECT
+    season,
+    driverName,
+    teamName,
+    LOWER(driverName) AS driverName_lower,
+    LOWER(teamName) AS teamName_lower,
+    races_count,
+    total_points,
+    wins,
+    podiums,
+    dnf_count,
+    avg_grid_position,
+    avg_finish_position,
+    final_champ_position
+FROM f1.f1_gold_driver_season_stats
+ORDER BY season DESC, total_points DESC;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS f1.mv_constructor_season_stats_ranked AS
+SELECT
+    season,
+    teamName,
+    teamNationality,
+    LOWER(teamName) AS teamName_lower,
+    entries_count,
+    team_total_points,
+    wins,
+    podiums,
+    dnf_count,
+    final_cons_position
+FROM f1.f1_gold_constructor_season_stats
+ORDER BY season DESC, team_total_points DESC;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS f1.mv_race_results_ranked AS
+SELECT
+    season,
+    round,
+    raceName,
+    circuitName,
+    country,
+    driverName,
+    teamName,
+    LOWER(raceName) AS raceName_lower,
+    LOWER(driverName) AS driverName_lower,
+    grid,
+    race_finish_position,
+    race_points,
+    pit_stop_count,
+    avg_pit_stop_ms,
+    statusDescription
+FROM f1.f1_gold_race_driver_features
+ORDER BY season DESC, round DESC, race_finish_position;
+
+-- Scheduled refresh (run after each gold build):
+-- REFRESH MATERIALIZED VIEW f1.mv_driver_season_stats_ranked;
+-- REFRESH MATERIALIZED VIEW f1.mv_constructor_season_stats_ranked;
+-- REFRESH MATERIALIZED VIEW f1.mv_race_results_ranked;
@@ -1,6 +1,6 @@
 """Configuration management using pydantic-settings."""
 
-from functools import lru_cache
+from functools import cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,6 +14,10 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
+        validate_default=False,
+        validate_assignment=False,
+        revalidate_instances="never",
     )
 
     databricks_host: str
@@ -26,17 +30,25 @@ class Settings(BaseSettings):
     query_timeout_seconds: int = 120
     max_result_rows: int = 10000
 
+    def model_post_init(self, __context) -> None:
+        # Precompute the qualification prefix once; these are read on
+        # every query build and the model is frozen anyway.
+        object.__setattr__(
+            self, "_prefix", f"{self.databricks_catalog}.{self.databricks_schema}."
+        )
+        object.__setattr__(self, "_prefix_nodot", self._prefix[:-1])
+
     @property
     def default_catalog_schema(self) -> str:
-        return f"{self.databricks_catalog}.{self.databricks_schema}"
+        return self._prefix_nodot
 
     def get_full_table_name(self, table_name: str) -> str:
         if "." in table_name:
             return table_name
-        return f"{self.default_catalog_schema}.{table_name}"
+        return self._prefix + table_name
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     return Settings()
 
@@ -9,9 +9,15 @@ from f1_mcp.tools import (
     register_sql_tools,
     register_schema_tools,
     register_visualization_tools,
+    register_ml_tools,
 )
 
 
+# CLI flags recognized by the __main__ entry point.
+_SSE_FLAGS = frozenset({"--sse", "-s"})
+_HELP_FLAGS = frozenset({"--help", "-h"})
+
+
 def create_server() -> FastMCP:
     mcp = FastMCP(
         name="f1-databricks-gateway",
@@ -20,6 +26,7 @@ def create_server() -> FastMCP:
     register_sql_tools(mcp)
     register_schema_tools(mcp)
     register_visualization_tools(mcp)
+    register_ml_tools(mcp)
 
     return mcp
 
@@ -27,9 +34,27 @@ def create_server() -> FastMCP:
 mcp = create_server()
 
 
+def _prewarm() -> None:
+    """Open the Databricks connection off the startup path.
+
+    Runs in a daemon thread so serving starts immediately while the
+    TLS handshake and warehouse wake-up happen in the background.
+    """
+    import threading
+
+    def _warm():
+        from f1_mcp.services.databricks_client import get_databricks_client
+
+        get_databricks_client().warm_up()
+
+    threading.Thread(target=_warm, name="db-prewarm", daemon=True).start()
+
+
 def main(transport: Optional[str] = None) -> None:
     transport = transport or "stdio"
 
+    _prewarm()
+
     if transport == "sse":
         mcp.run(transport="sse")
     else:
@@ -38,20 +63,20 @@ def main(transport: Optional[str] = None) -> None:
 
 if __name__ == "__main__":
     transport = "stdio"
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ("--sse", "-s"):
-            transport = "sse"
-        elif sys.argv[1] in ("--help", "-h"):
-            print("F1 Databricks MCP Server")
-            print()
-            print("Usage: f1-mcp [OPTIONS]")
-            print()
-            print("Options:")
-            print("  --sse, -s    Use SSE transport (for web-based agents)")
-            print("  --help, -h   Show this help message")
-            print()
-            print("By default, uses stdio transport for Claude Desktop.")
-            sys.exit(0)
+    arg = sys.argv[1] if len(sys.argv) > 1 else ""
+    if arg in _SSE_FLAGS:
+        transport = "sse"
+    elif arg in _HELP_FLAGS:
+        print("F1 Databricks MCP Server")
+        print()
+        print("Usage: f1-mcp [OPTIONS]")
+        print()
+        print("Options:")
+        print("  --sse, -s    Use SSE transport (for web-based agents)")
+        print("  --help, -h   Show this help message")
+        print()
+        print("By default, uses stdio transport for Claude Desktop.")
+        sys.exit(0)
 
     main(transport)
 
@@ -1,8 +1,10 @@
-"""Service layer for F1 MCP Server."""
+"""Service layer for F1 MCP Server.
 
-from f1_mcp.services.databricks_client import DatabricksClient
-from f1_mcp.services.chart_service import ChartService
-from f1_mcp.services.model_service import ModelService
+Service classes are resolved lazily (PEP 562) so importing this package
+does not pull in matplotlib or the Databricks SDK at server startup.
+"""
+
+import importlib
 
 __all__ = [
     "DatabricksClient",
@@ -10,3 +12,15 @@ __all__ = [
     "ModelService",
 ]
 
+_SERVICE_MODULES = {
+    "DatabricksClient": "f1_mcp.services.databricks_client",
+    "ChartService": "f1_mcp.services.chart_service",
+    "ModelService": "f1_mcp.services.model_service",
+}
+
+
+def __getattr__(name: str):
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -2,13 +2,20 @@
 
 import base64
 import io
+import sys
+import threading
+from collections import deque
 from typing import Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from functools import cache, lru_cache
+
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+import matplotlib.style
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 
 
@@ -23,22 +30,54 @@ class ChartType(str, Enum):
     HORIZONTAL_BAR = "horizontal_bar"
 
 
-@dataclass
+# Intern the tag values so downstream string comparisons on chart_type
+# short-circuit on identity instead of hashing.
+for _m in ChartType:
+    object.__setattr__(_m, "_value_", sys.intern(_m._value_))
+del _m
+
+
+@dataclass(slots=True)
 class ChartResult:
-    chart_base64: str
+    png_bytes: bytes
     chart_type: str
     title: str
     description: str
     data_summary: dict[str, Any]
+    _chart_base64: Optional[str] = None
 
-    def to_dict(self) -> dict[str, Any]:    
-        return {
-            "chart_base64": self.chart_base64,
-            "chart_type": self.chart_type,
-            "title": self.title,
-            "description": self.description,
-            "data_summary": self.data_summary,
-        }
+    _FIELDS = (
+        "chart_base64",
+        "chart_type",
+        "title",
+        "description",
+        "data_summary",
+    )
+
+    @property
+    def chart_base64(self) -> str:
+        """Base64 PNG, encoded on first access.
+
+        In-process consumers (file saves) read png_bytes directly and
+        never pay for the 1.3x base64 expansion.
+        """
+        if self._chart_base64 is None:
+            self._chart_base64 = base64.b64encode(
+                self.png_bytes).decode("ascii")
+        return self._chart_base64
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+
+@lru_cache(maxsize=None)
+def _apply_style(style: str) -> None:
+    """Apply a Matplotlib style sheet once per process.
+
+    style.use deep-copies rcParams; caching makes repeated service
+    construction (and any future per-chart styling) a no-op.
+    """
+    matplotlib.style.use(style)
 
 
 class ChartService:
@@ -57,25 +96,68 @@ class ChartService:
         "#FF80C7",  # Alpine Pink
     ]
 
+    # Precomputed palette slices so _get_colors is a plain tuple lookup
+    # for the common n <= len(COLORS) case; populated below the class
+    # body (class-scope comprehensions cannot see class attributes).
+    _COLOR_PREFIXES: tuple[tuple[str, ...], ...]
+
     def __init__(self, style: str = "seaborn-v0_8-darkgrid"):
         self._style = style
+        _apply_style(style)
         self._dpi = 100
         self._figsize = (10, 6)
-
-    def _fig_to_base64(self, fig: plt.Figure) -> str:
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=self._dpi, bbox_inches="tight")
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-        buf.close()
-        plt.close(fig)
-        return img_base64
-
-    def _get_colors(self, n: int) -> list[str]:
+        # Per-thread pools of reusable Figure objects keyed by figsize;
+        # avoids pyplot's global state machine and per-chart allocation.
+        self._local = threading.local()
+
+    def _acquire_fig(self, figsize: tuple[float, float]) -> Figure:
+        key = (float(figsize[0]), float(figsize[1]))
+        pools = getattr(self._local, "pools", None)
+        if pools is None:
+            pools = self._local.pools = {}
+        pool = pools.setdefault(key, deque())
+        if pool:
+            return pool.pop()
+        fig = Figure(figsize=key, dpi=self._dpi)
+        FigureCanvasAgg(fig)
+        fig.set_layout_engine("tight")
+        return fig
+
+    def _release_fig(self, fig: Figure) -> None:
+        fig.clf()
+        key = tuple(float(v) for v in fig.get_size_inches())
+        self._local.pools.setdefault(key, deque()).append(fig)
+
+    @staticmethod
+    def _rotate_xticklabels(ax) -> None:
+        for label in ax.get_xticklabels():
+            label.set_rotation(45)
+            label.set_horizontalalignment("right")
+
+    def _fig_to_png(self, fig: Figure) -> bytes:
+        canvas = fig.canvas
+        canvas.draw()
+        # Reuse one buffer per thread; the PNG is copied out once and
+        # base64 encoding is deferred to ChartResult.chart_base64.
+        buf = getattr(self._local, "buf", None)
+        if buf is None:
+            buf = self._local.buf = io.BytesIO()
+        else:
+            buf.seek(0)
+            buf.truncate(0)
+        # Deflate level 1: chart PNGs are a few percent larger than at
+        # the default level 6 but encode several times faster, and the
+        # encode sits on every tool call.
+        canvas.print_png(buf, pil_kwargs={"compress_level": 1})
+        png = bytes(buf.getbuffer())
+        self._release_fig(fig)
+        return png
+
+    def _get_colors(self, n: int) -> tuple[str, ...]:
         if n <= len(self.COLORS):
-            return self.COLORS[:n]
+            return self._COLOR_PREFIXES[n]
         # Cycle colors if more are needed
-        return [self.COLORS[i % len(self.COLORS)] for i in range(n)]
+        return _cycle_colors(n)
 
     def create_bar_chart(
         self,
@@ -87,39 +169,44 @@ class ChartService:
         horizontal: bool = False,
         color: Optional[str] = None,
     ) -> ChartResult:
-        fig, ax = plt.subplots(figsize=self._figsize)
+        fig = self._acquire_fig(self._figsize)
+        ax = fig.add_subplot(111)
 
         bar_color = color or self.COLORS[0]
+        arr = np.asarray(values, dtype=np.float64)
 
         if horizontal:
-            bars = ax.barh(labels, values, color=bar_color)
+            bars = ax.barh(labels, arr, color=bar_color)
             ax.set_xlabel(ylabel)
             ax.set_ylabel(xlabel)
         else:
-            bars = ax.bar(labels, values, color=bar_color)
+            bars = ax.bar(labels, arr, color=bar_color)
             ax.set_xlabel(xlabel)
             ax.set_ylabel(ylabel)
-            plt.xticks(rotation=45, ha="right")
+            self._rotate_xticklabels(ax)
 
         ax.set_title(title, fontsize=14, fontweight="bold")
-        plt.tight_layout()
+
+        vmax = float(arr.max())
+        vmin = float(arr.min())
+        vavg = float(arr.mean())
 
         summary = {
-            "total": sum(values),
-            "average": np.mean(values),
-            "max": max(values),
-            "min": min(values),
-            "count": len(values),
+            "total": float(arr.sum()),
+            "average": vavg,
+            "max": vmax,
+            "min": vmin,
+            "count": int(arr.size),
         }
 
         description = (
             f"Bar chart showing {len(labels)} categories. "
-            f"Max: {max(values):.2f}, Min: {min(values):.2f}, "
-            f"Average: {np.mean(values):.2f}"
+            f"Max: {vmax:.2f}, Min: {vmin:.2f}, "
+            f"Average: {vavg:.2f}"
         )
 
         return ChartResult(
-            chart_base64=self._fig_to_base64(fig),
+            png_bytes=self._fig_to_png(fig),
             chart_type=ChartType.HORIZONTAL_BAR if horizontal else ChartType.BAR,
             title=title,
             description=description,
@@ -134,7 +221,8 @@ class ChartService:
         xlabel: str = "",
         ylabel: str = "",
     ) -> ChartResult:
-        fig, ax = plt.subplots(figsize=self._figsize)
+        fig = self._acquire_fig(self._figsize)
+        ax = fig.add_subplot(111)
 
         colors = self._get_colors(len(y_series))
 
@@ -147,26 +235,28 @@ class ChartService:
         ax.set_title(title, fontsize=14, fontweight="bold")
         ax.legend(loc="best")
         ax.grid(True, alpha=0.3)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
+        self._rotate_xticklabels(ax)
 
         summary = {
             "series_count": len(y_series),
             "x_range": [str(x_values[0]), str(x_values[-1])] if x_values else [],
             "series_stats": {
                 name: {
-                    "max": max(vals) if vals else 0,
-                    "min": min(vals) if vals else 0,
-                    "avg": np.mean(vals) if vals else 0,
+                    "max": float(arr.max()) if arr.size else 0,
+                    "min": float(arr.min()) if arr.size else 0,
+                    "avg": float(arr.mean()) if arr.size else 0,
                 }
-                for name, vals in y_series.items()
+                for name, arr in (
+                    (name, np.asarray(vals, dtype=np.float64))
+                    for name, vals in y_series.items()
+                )
             },
         }
 
         description = f"Line chart with {len(y_series)} series over {len(x_values)} data points."
 
         return ChartResult(
-            chart_base64=self._fig_to_base64(fig),
+            png_bytes=self._fig_to_png(fig),
             chart_type=ChartType.LINE,
             title=title,
             description=description,
@@ -181,7 +271,8 @@ class ChartService:
         xlabel: str = "",
         ylabel: str = "",
     ) -> ChartResult:
-        fig, ax = plt.subplots(figsize=self._figsize)
+        fig = self._acquire_fig(self._figsize)
+        ax = fig.add_subplot(111)
 
         x = np.arange(len(categories))
         width = 0.8 / len(groups)
@@ -197,7 +288,6 @@ class ChartService:
         ax.set_xticks(x)
         ax.set_xticklabels(categories, rotation=45, ha="right")
         ax.legend(loc="best")
-        plt.tight_layout()
 
         summary = {
             "categories": len(categories),
@@ -208,7 +298,7 @@ class ChartService:
         description = f"Grouped bar chart comparing {len(groups)} groups across {len(categories)} categories."
 
         return ChartResult(
-            chart_base64=self._fig_to_base64(fig),
+            png_bytes=self._fig_to_png(fig),
             chart_type=ChartType.GROUPED_BAR,
             title=title,
             description=description,
@@ -225,10 +315,14 @@ class ChartService:
         labels: Optional[list[str]] = None,
         size: Optional[list[float]] = None,
     ) -> ChartResult:
-        fig, ax = plt.subplots(figsize=self._figsize)
+        fig = self._acquire_fig(self._figsize)
+        ax = fig.add_subplot(111)
+
+        xa = np.asarray(x_values, dtype=np.float64)
+        ya = np.asarray(y_values, dtype=np.float64)
 
         sizes = size if size else [50] * len(x_values)
-        scatter = ax.scatter(x_values, y_values, s=sizes, c=self.COLORS[0], 
+        scatter = ax.scatter(xa, ya, s=sizes, c=self.COLORS[0],
                             alpha=0.7, edgecolors="white")
 
         if labels:
@@ -240,18 +334,22 @@ class ChartService:
         ax.set_ylabel(ylabel)
         ax.set_title(title, fontsize=14, fontweight="bold")
         ax.grid(True, alpha=0.3)
-        plt.tight_layout()
 
-        if len(x_values) > 1:
-            correlation = np.corrcoef(x_values, y_values)[0, 1]
-        else:
-            correlation = 0
+        # Direct Pearson formula; np.corrcoef would build a full 2x2
+        # covariance matrix (and a 2xN intermediate) for one scalar.
+        correlation = 0.0
+        if xa.size > 1:
+            xm = xa - xa.mean()
+            ym = ya - ya.mean()
+            denom = np.sqrt((xm @ xm) * (ym @ ym))
+            if denom > 0:
+                correlation = float(xm @ ym / denom)
 
         summary = {
-            "point_count": len(x_values),
+            "point_count": int(xa.size),
             "correlation": correlation,
-            "x_range": [min(x_values), max(x_values)],
-            "y_range": [min(y_values), max(y_values)],
+            "x_range": [float(xa.min()), float(xa.max())],
+            "y_range": [float(ya.min()), float(ya.max())],
         }
 
         description = (
@@ -260,7 +358,7 @@ class ChartService:
         )
 
         return ChartResult(
-            chart_base64=self._fig_to_base64(fig),
+            png_bytes=self._fig_to_png(fig),
             chart_type=ChartType.SCATTER,
             title=title,
             description=description,
@@ -275,8 +373,9 @@ class ChartService:
         title: str,
         cmap: str = "RdYlGn_r",
     ) -> ChartResult:
-        fig, ax = plt.subplots(figsize=(max(10, len(x_labels) * 0.8), 
-                                        max(6, len(y_labels) * 0.5)))
+        fig = self._acquire_fig((max(10, len(x_labels) * 0.8),
+                                 max(6, len(y_labels) * 0.5)))
+        ax = fig.add_subplot(111)
 
         data_array = np.array(data)
         im = ax.imshow(data_array, cmap=cmap, aspect="auto")
@@ -288,16 +387,16 @@ class ChartService:
         ax.set_xticklabels(x_labels, rotation=45, ha="right")
         ax.set_yticklabels(y_labels)
 
-        # Add text annotations
-        for i in range(len(y_labels)):
-            for j in range(len(x_labels)):
-                if i < len(data) and j < len(data[i]):
-                    text = ax.text(j, i, f"{data[i][j]:.2f}",
-                                  ha="center", va="center", 
-                                  fontsize=8, color="black")
+        # Annotate cells only while the grid stays readable; formatting is
+        # done in one vectorized pass instead of f-string per cell.
+        if data_array.size <= 400:
+            labels_arr = np.char.mod("%.2f", data_array)
+            for i, j in np.ndindex(data_array.shape):
+                ax.text(j, i, labels_arr[i, j],
+                        ha="center", va="center",
+                        fontsize=8, color="black")
 
         ax.set_title(title, fontsize=14, fontweight="bold")
-        plt.tight_layout()
 
         summary = {
             "rows": len(y_labels),
@@ -310,7 +409,7 @@ class ChartService:
         description = f"Heatmap with {len(y_labels)} rows and {len(x_labels)} columns."
 
         return ChartResult(
-            chart_base64=self._fig_to_base64(fig),
+            png_bytes=self._fig_to_png(fig),
             chart_type=ChartType.HEATMAP,
             title=title,
             description=description,
@@ -324,7 +423,8 @@ class ChartService:
         xlabel: str = "",
         ylabel: str = "",
     ) -> ChartResult:
-        fig, ax = plt.subplots(figsize=self._figsize)
+        fig = self._acquire_fig(self._figsize)
+        ax = fig.add_subplot(111)
 
         labels = list(data.keys())
         values = list(data.values())
@@ -339,29 +439,31 @@ class ChartService:
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
         ax.set_title(title, fontsize=14, fontweight="bold")
-        plt.xticks(rotation=45, ha="right")
+        self._rotate_xticklabels(ax)
         ax.grid(True, alpha=0.3, axis="y")
-        plt.tight_layout()
 
         summary = {
             "categories": len(labels),
             "statistics": {
                 name: {
-                    "median": float(np.median(vals)),
-                    "mean": float(np.mean(vals)),
-                    "std": float(np.std(vals)),
-                    "min": float(min(vals)),
-                    "max": float(max(vals)),
-                    "count": len(vals),
+                    "median": float(np.median(arr)),
+                    "mean": float(arr.mean()),
+                    "std": float(arr.std()),
+                    "min": float(arr.min()),
+                    "max": float(arr.max()),
+                    "count": int(arr.size),
                 }
-                for name, vals in data.items()
+                for name, arr in (
+                    (name, np.asarray(vals, dtype=np.float64))
+                    for name, vals in data.items()
+                )
             },
         }
 
         description = f"Box plot showing distribution across {len(labels)} categories."
 
         return ChartResult(
-            chart_base64=self._fig_to_base64(fig),
+            png_bytes=self._fig_to_png(fig),
             chart_type=ChartType.BOX,
             title=title,
             description=description,
@@ -369,12 +471,19 @@ class ChartService:
         )
 
 
-_chart_service: Optional[ChartService] = None
+ChartService._COLOR_PREFIXES = tuple(
+    tuple(ChartService.COLORS[:i]) for i in range(len(ChartService.COLORS) + 1)
+)
+
+
+@lru_cache(maxsize=None)
+def _cycle_colors(n: int) -> tuple[str, ...]:
+    """Cycle the palette for charts needing more colors than it holds."""
+    colors = ChartService.COLORS
+    return tuple(colors[i % len(colors)] for i in range(n))
 
 
+@cache
 def get_chart_service() -> ChartService:
-    global _chart_service
-    if _chart_service is None:
-        _chart_service = ChartService()
-    return _chart_service
+    return ChartService()
 
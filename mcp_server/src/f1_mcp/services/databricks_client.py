@@ -1,26 +1,57 @@
 """Databricks SDK wrapper for SQL execution and schema discovery."""
 
-from typing import Any, Optional
+from __future__ import annotations
 
-from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.sql import (
-    StatementState,
-    ExecuteStatementRequestOnWaitTimeout,
-)
+import base64
+import json
+import sys
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from f1_mcp.config import Settings, get_settings
+from f1_mcp.utils.ttl_cache import ttl_cache
+
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+    from databricks.sdk.service.sql import StatementParameterListItem
 
 
 class DatabricksClient:
     """Client for interacting with Databricks SQL warehouse."""
 
+    # Databricks column type name -> NumPy dtype for return_format="numpy".
+    # Anything unmapped (STRING, BOOLEAN, complex types) stays object.
+    _NUMPY_DTYPES = {
+        "TINYINT": "int64",
+        "SMALLINT": "int64",
+        "INT": "int64",
+        "LONG": "int64",
+        "BIGINT": "int64",
+        "FLOAT": "float64",
+        "DOUBLE": "float64",
+        "DECIMAL": "float64",
+        "DATE": "datetime64[ns]",
+        "TIMESTAMP": "datetime64[ns]",
+    }
+
     def __init__(self, settings: Optional[Settings] = None):
+        # databricks.sdk is imported lazily (here and in the client
+        # property) to keep server cold start free of its import cost.
+        from databricks.sdk.service.sql import ExecuteStatementRequestOnWaitTimeout
+
         self._settings = settings or get_settings()
         self._client: Optional[WorkspaceClient] = None
+        # Invariants of every execute_statement call, computed once.
+        self._wait_timeout_str = (
+            f"{max(min(self._settings.query_timeout_seconds, 50), 5)}s"
+        )
+        self._on_wait_timeout = ExecuteStatementRequestOnWaitTimeout.CONTINUE
 
     @property
     def client(self) -> WorkspaceClient:
         if self._client is None:
+            from databricks.sdk import WorkspaceClient
+
             self._client = WorkspaceClient(
                 host=self._settings.databricks_host,
                 token=self._settings.databricks_token,
@@ -31,32 +62,66 @@ class DatabricksClient:
         self,
         query: str,
         max_rows: Optional[int] = None,
+        return_format: Literal["rows", "columns", "numpy"] = "rows",
+        parameters: Optional[list[StatementParameterListItem]] = None,
     ) -> dict[str, Any]:
+        """Execute a SQL statement and return the result.
+
+        return_format="rows" yields the legacy list of per-row dicts;
+        "columns" yields a single column-name -> list-of-values dict,
+        which avoids one dict allocation per row for large results;
+        "numpy" yields column-name -> ndarray typed from the result
+        manifest, ready to be handed to NumPy/Matplotlib directly.
+        """
+        from databricks.sdk.service.sql import StatementState
+
         max_rows = max_rows or self._settings.max_result_rows
 
         try:
-            wait_timeout = min(self._settings.query_timeout_seconds, 50)
-            wait_timeout = max(wait_timeout, 5)
-            
             statement = self.client.statement_execution.execute_statement(
                 warehouse_id=self._settings.databricks_warehouse_id,
                 statement=query,
-                wait_timeout=f"{wait_timeout}s",
-                on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CONTINUE,
+                wait_timeout=self._wait_timeout_str,
+                on_wait_timeout=self._on_wait_timeout,
                 row_limit=max_rows,
+                parameters=parameters,
             )
 
             if statement.status.state == StatementState.SUCCEEDED:
-                columns = []
-                rows = []
-
+                schema_columns = []
                 if statement.manifest and statement.manifest.schema:
-                    columns = [col.name for col in statement.manifest.schema.columns]
+                    schema_columns = statement.manifest.schema.columns
+                # Interned names make every row dict share one key
+                # object per column, so later lookups hit the
+                # pointer-equality fast path instead of comparing
+                # characters.
+                columns = [sys.intern(col.name) for col in schema_columns]
 
+                data_array = []
                 if statement.result and statement.result.data_array:
-                    for row_data in statement.result.data_array:
-                        rows.append(dict(zip(columns, row_data)))
+                    data_array = statement.result.data_array
+
+                if return_format == "numpy":
+                    return {
+                        "success": True,
+                        "columns": columns,
+                        "arrays": self._to_numpy_arrays(schema_columns, data_array),
+                        "row_count": len(data_array),
+                    }
+
+                if return_format == "columns":
+                    if data_array:
+                        columns_data = list(map(list, zip(*data_array)))
+                    else:
+                        columns_data = [[] for _ in columns]
+                    return {
+                        "success": True,
+                        "columns": columns,
+                        "data": dict(zip(columns, columns_data)),
+                        "row_count": len(data_array),
+                    }
 
+                rows = [dict(zip(columns, row_data)) for row_data in data_array]
                 return {
                     "success": True,
                     "columns": columns,
@@ -79,44 +144,204 @@ class DatabricksClient:
                 "error": str(e),
             }
 
+    def execute_query_paged(
+        self,
+        query: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Execute a statement and return one page of its result.
+
+        The first call runs the query and returns the warehouse's first
+        result chunk plus, when more chunks exist, an opaque
+        "next_cursor" token. Passing that token back (query is then
+        ignored) fetches the next chunk from the already-executed
+        statement without re-running it. Chunk sizing is decided by the
+        warehouse; max_rows still bounds the overall result.
+        """
+        from databricks.sdk.service.sql import StatementState
+
+        if cursor:
+            try:
+                token = json.loads(base64.urlsafe_b64decode(cursor))
+                statement_id = token["sid"]
+                chunk_index = token["chunk"]
+                columns = token["cols"]
+            except Exception:
+                return {
+                    "success": False,
+                    "error": "Invalid or expired cursor",
+                }
+
+            try:
+                chunk = self.client.statement_execution.get_statement_result_chunk_n(
+                    statement_id, chunk_index
+                )
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": str(e),
+                }
+
+            data_array = chunk.data_array or []
+            rows = [dict(zip(columns, row_data)) for row_data in data_array]
+            return {
+                "success": True,
+                "columns": columns,
+                "rows": rows,
+                "row_count": len(rows),
+                "next_cursor": self._page_cursor(
+                    statement_id, chunk.next_chunk_index, columns
+                ),
+            }
+
+        max_rows = max_rows or self._settings.max_result_rows
+
+        try:
+            statement = self.client.statement_execution.execute_statement(
+                warehouse_id=self._settings.databricks_warehouse_id,
+                statement=query,
+                wait_timeout=self._wait_timeout_str,
+                on_wait_timeout=self._on_wait_timeout,
+                row_limit=max_rows,
+            )
+
+            if statement.status.state != StatementState.SUCCEEDED:
+                error_msg = "Query did not succeed"
+                if statement.status.error:
+                    error_msg = statement.status.error.message
+                return {
+                    "success": False,
+                    "error": error_msg,
+                    "state": str(statement.status.state),
+                }
+
+            schema_columns = []
+            if statement.manifest and statement.manifest.schema:
+                schema_columns = statement.manifest.schema.columns
+            columns = [sys.intern(col.name) for col in schema_columns]
+
+            data_array = []
+            next_chunk_index = None
+            if statement.result:
+                data_array = statement.result.data_array or []
+                next_chunk_index = statement.result.next_chunk_index
+
+            rows = [dict(zip(columns, row_data)) for row_data in data_array]
+            return {
+                "success": True,
+                "columns": columns,
+                "rows": rows,
+                "row_count": len(rows),
+                "next_cursor": self._page_cursor(
+                    statement.statement_id, next_chunk_index, columns
+                ),
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+            }
+
+    def stream_query(
+        self,
+        query: str,
+        max_rows: Optional[int] = None,
+    ):
+        """Yield result rows in warehouse-sized chunks.
+
+        Each item is a (columns, rows) pair for one result chunk, so
+        consumers can process a large result without ever holding all
+        of it. Raises RuntimeError on statement failure, since a
+        generator cannot return the usual error dict.
+        """
+        page = self.execute_query_paged(query, max_rows=max_rows)
+        while True:
+            if not page.get("success"):
+                raise RuntimeError(page.get("error", "Query did not succeed"))
+            yield page["columns"], page["rows"]
+            cursor = page.get("next_cursor")
+            if cursor is None:
+                return
+            page = self.execute_query_paged(cursor=cursor)
+
+    @staticmethod
+    def _page_cursor(
+        statement_id: Optional[str],
+        next_chunk_index: Optional[int],
+        columns: list[str],
+    ) -> Optional[str]:
+        """Encode the continuation token for execute_query_paged."""
+        if next_chunk_index is None:
+            return None
+        token = {"sid": statement_id, "chunk": next_chunk_index, "cols": columns}
+        return base64.urlsafe_b64encode(json.dumps(token).encode()).decode("ascii")
+
+    @classmethod
+    def _to_numpy_arrays(cls, schema_columns, data_array) -> dict[str, Any]:
+        """Build one typed ndarray per column from a raw result."""
+        import numpy as np
+
+        arrays: dict[str, Any] = {}
+        column_values = zip(*data_array) if data_array else ([] for _ in schema_columns)
+        for col, values in zip(schema_columns, column_values):
+            type_name = col.type_name.value if col.type_name else ""
+            dtype = cls._NUMPY_DTYPES.get(type_name, object)
+            try:
+                arrays[col.name] = np.asarray(values, dtype=dtype)
+            except (TypeError, ValueError):
+                # NULLs or malformed values; keep the column as objects.
+                arrays[col.name] = np.asarray(values, dtype=object)
+        return arrays
+
     def list_tables(
         self,
         catalog: Optional[str] = None,
         schema: Optional[str] = None,
     ) -> dict[str, Any]:
+        from databricks.sdk.service.sql import StatementParameterListItem
+
         catalog = catalog or self._settings.databricks_catalog
         schema = schema or self._settings.databricks_schema
 
-        query = f"""
-        SELECT table_name, table_type, comment
-        FROM {catalog}.information_schema.tables
-        WHERE table_schema = '{schema}'
-        ORDER BY table_name
-        """
-        return self.execute_query(query)
+        return self.execute_query(
+            _tables_query(catalog),
+            parameters=[StatementParameterListItem(name="schema", value=schema)],
+        )
 
+    @ttl_cache(maxsize=64, ttl_seconds=300)
     def get_table_schema(
         self,
         table_name: str,
         catalog: Optional[str] = None,
         schema: Optional[str] = None,
     ) -> dict[str, Any]:
+        from databricks.sdk.service.sql import StatementParameterListItem
+
         catalog = catalog or self._settings.databricks_catalog
         schema = schema or self._settings.databricks_schema
 
-        query = f"""
-        SELECT 
-            column_name,
-            data_type,
-            is_nullable,
-            column_default,
-            comment
-        FROM {catalog}.information_schema.columns
-        WHERE table_schema = '{schema}'
-          AND table_name = '{table_name}'
-        ORDER BY ordinal_position
+        return self.execute_query(
+            _columns_query(catalog),
+            parameters=[
+                StatementParameterListItem(name="schema", value=schema),
+                StatementParameterListItem(name="tname", value=table_name),
+            ],
+        )
+
+    def warm_up(self) -> None:
+        """Prime the HTTP session and warehouse with a trivial query.
+
+        The SDK keeps keepalive connections in its session, so paying
+        the TCP+TLS handshake (and any warehouse wake-up) here takes it
+        off the first real tool call. Failures are swallowed: the
+        server must still start when the warehouse is unreachable.
         """
-        return self.execute_query(query)
+        try:
+            self.execute_query("SELECT 1", max_rows=1)
+        except Exception:
+            pass
 
     def get_table_sample(
         self,
@@ -128,13 +353,36 @@ class DatabricksClient:
         return self.execute_query(query)
 
 
-_client_instance: Optional[DatabricksClient] = None
+# The catalog sits in identifier position, so it cannot be a bind
+# parameter; cache the formatted SQL per catalog instead.
+@lru_cache(maxsize=None)
+def _tables_query(catalog: str) -> str:
+    return f"""
+        SELECT table_name, table_type, comment
+        FROM {catalog}.information_schema.tables
+        WHERE table_schema = :schema
+        ORDER BY table_name
+        """
+
+
+@lru_cache(maxsize=None)
+def _columns_query(catalog: str) -> str:
+    return f"""
+        SELECT
+            column_name,
+            data_type,
+            is_nullable,
+            column_default,
+            comment
+        FROM {catalog}.information_schema.columns
+        WHERE table_schema = :schema
+          AND table_name = :tname
+        ORDER BY ordinal_position
+        """
 
 
+@cache
 def get_databricks_client() -> DatabricksClient:
     """Get or create the DatabricksClient instance."""
-    global _client_instance
-    if _client_instance is None:
-        _client_instance = DatabricksClient()
-    return _client_instance
+    return DatabricksClient()
 
@@ -1,9 +1,17 @@
 """ML Model service for pit stop predictions (placeholder)."""
 
+from bisect import bisect_right
+from functools import cache, lru_cache
 from typing import Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+# Placeholder heuristic: race_laps < 40 -> 1 stop, < 60 -> 2, else 3.
+_PIT_COUNT_THRESHOLDS = (40, 60)
+_PIT_COUNT_VALUES = (1, 2, 3)
+
+_AVG_PIT_MS = 2500.0
+
 
 class PredictionType(str, Enum):
     """Types of pit stop predictions available."""
@@ -11,7 +19,7 @@ class PredictionType(str, Enum):
     PIT_STOP_DURATION = "pit_stop_duration"
 
 
-@dataclass
+@dataclass(slots=True)
 class PitStopPrediction:
     """Result of a pit stop prediction."""
     prediction_type: PredictionType
@@ -72,23 +80,10 @@ class ModelService:
         Note:
             This is a placeholder. Replace with actual model inference.
         """
-        if race_laps < 40:
-            estimated_pits = 1
-        elif race_laps < 60:
-            estimated_pits = 2
-        else:
-            estimated_pits = 3
-
-        return PitStopPrediction(
-            prediction_type=PredictionType.OPTIMAL_PIT_COUNT,
-            optimal_pit_count=estimated_pits,
-            confidence=0.0,  # Zero confidence for placeholder
-            model_version=self._model_version,
-            message=(
-                "PLACEHOLDER: This is a placeholder prediction. "
-                "Integration of the model is on the way"
-            ),
-        )
+        estimated_pits = _PIT_COUNT_VALUES[
+            bisect_right(_PIT_COUNT_THRESHOLDS, race_laps)
+        ]
+        return _cached_pit_count_prediction(estimated_pits)
 
     def predict_pit_stop_duration(
         self,
@@ -113,20 +108,7 @@ class ModelService:
         Note:
             This is a placeholder. Replace with actual model inference.
         """
-        estimated_avg_ms = 2500.0
-        estimated_total_ms = estimated_avg_ms * pit_stop_number
-
-        return PitStopPrediction(
-            prediction_type=PredictionType.PIT_STOP_DURATION,
-            predicted_avg_pit_ms=estimated_avg_ms,
-            predicted_total_pit_ms=estimated_total_ms,
-            confidence=0.0,
-            model_version=self._model_version,
-            message=(
-                "PLACEHOLDER: This is a placeholder prediction. "
-                "Integrate your trained ML model here for accurate predictions."
-            ),
-        )
+        return _cached_duration_prediction(pit_stop_number)
 
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the loaded model."""
@@ -145,13 +127,39 @@ class ModelService:
         }
 
 
-_model_instance: Optional[ModelService] = None
-
-
+# In placeholder mode there are only a handful of distinct predictions;
+# cache them so repeated MCP calls allocate nothing.
+@lru_cache(maxsize=None)
+def _cached_pit_count_prediction(estimated_pits: int) -> PitStopPrediction:
+    return PitStopPrediction(
+        prediction_type=PredictionType.OPTIMAL_PIT_COUNT,
+        optimal_pit_count=estimated_pits,
+        confidence=0.0,  # Zero confidence for placeholder
+        model_version="placeholder-v0.1",
+        message=(
+            "PLACEHOLDER: This is a placeholder prediction. "
+            "Integration of the model is on the way"
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _cached_duration_prediction(pit_stop_number: int) -> PitStopPrediction:
+    return PitStopPrediction(
+        prediction_type=PredictionType.PIT_STOP_DURATION,
+        predicted_avg_pit_ms=_AVG_PIT_MS,
+        predicted_total_pit_ms=_AVG_PIT_MS * pit_stop_number,
+        confidence=0.0,
+        model_version="placeholder-v0.1",
+        message=(
+            "PLACEHOLDER: This is a placeholder prediction. "
+            "Integrate your trained ML model here for accurate predictions."
+        ),
+    )
+
+
+@cache
 def get_model_service() -> ModelService:
     """Get or create the singleton ModelService instance."""
-    global _model_instance
-    if _model_instance is None:
-        _model_instance = ModelService()
-    return _model_instance
+    return ModelService()
 
@@ -3,10 +3,12 @@
 from f1_mcp.tools.sql_tools import register_sql_tools
 from f1_mcp.tools.schema_tools import register_schema_tools
 from f1_mcp.tools.visualization_tools import register_visualization_tools
+from f1_mcp.tools.ml_tools import register_ml_tools
 
 __all__ = [
     "register_sql_tools",
     "register_schema_tools",
     "register_visualization_tools",
+    "register_ml_tools",
 ]
 
@@ -0,0 +1,214 @@
+"""ML prediction and race analysis tools for MCP server."""
+
+from typing import Any, Optional
+
+from fastmcp import FastMCP
+
+from f1_mcp.services.databricks_client import get_databricks_client
+from f1_mcp.services.model_service import (
+    PredictionType,
+    get_model_service,
+)
+from f1_mcp.utils.ttl_cache import ttl_cache
+
+# The enum is fixed at import; precompute the lookup table and the
+# error-message fragment so validation never raises.
+_PRED_TYPE_BY_NAME = {p.value: p for p in PredictionType}
+_VALID_PREDICTION_TYPES = ", ".join(_PRED_TYPE_BY_NAME)
+
+# Invariant SQL body, built once at import; only the WHERE fragment is
+# assembled per call (see sql_tools for the same pattern).
+_PIT_STATS_SQL = """
+        SELECT
+            season,
+            teamName,
+            COUNT(*) as entries,
+            AVG(pit_stop_count) as avg_pit_stops,
+            AVG(avg_pit_stop_ms) as avg_pit_stop_ms,
+            MIN(avg_pit_stop_ms) as best_avg_pit_stop_ms,
+            MAX(avg_pit_stop_ms) as worst_avg_pit_stop_ms
+        FROM f1.f1_gold_race_driver_features
+        WHERE {where}
+        GROUP BY season, teamName
+        ORDER BY season DESC, avg_pit_stop_ms
+        LIMIT :limit
+        """
+
+
+def register_ml_tools(mcp: FastMCP) -> None:
+    # Closure-cell bindings of the singleton accessors (see
+    # register_sql_tools for rationale).
+    get_client = get_databricks_client
+    get_service = get_model_service
+
+    @mcp.tool()
+    def predict_pit_stops(
+        prediction_type: str = "optimal_pit_count",
+        circuit_id: int = 0,
+        driver_id: int = 0,
+        constructor_id: int = 0,
+        season: int = 2024,
+        race_laps: int = 55,
+        pit_stop_number: int = 1,
+        weather_conditions: Optional[str] = None,
+        tire_compound: Optional[str] = None,
+    ) -> dict[str, Any]:
+        service = get_service()
+
+        ptype = _PRED_TYPE_BY_NAME.get(prediction_type)
+        if ptype is None:
+            return {
+                "success": False,
+                "error": (
+                    "Invalid prediction_type. Choose from: "
+                    + _VALID_PREDICTION_TYPES
+                ),
+            }
+
+        if ptype == PredictionType.OPTIMAL_PIT_COUNT:
+            prediction = service.predict_optimal_pit_count(
+                circuit_id=circuit_id,
+                driver_id=driver_id,
+                season=season,
+                race_laps=race_laps,
+                weather_conditions=weather_conditions,
+                tire_compound=tire_compound,
+            )
+        else:
+            prediction = service.predict_pit_stop_duration(
+                circuit_id=circuit_id,
+                driver_id=driver_id,
+                constructor_id=constructor_id,
+                season=season,
+                pit_stop_number=pit_stop_number,
+            )
+
+        # to_dict() already returns a fresh dict; annotate it in place
+        # instead of spreading it into a second allocation.
+        payload = prediction.to_dict()
+        payload["success"] = True
+        return payload
+
+    @mcp.tool()
+    @ttl_cache(maxsize=1, ttl_seconds=300)
+    def get_model_info() -> dict[str, Any]:
+        service = get_service()
+        return {
+            "success": True,
+            **service.get_model_info(),
+        }
+
+    @mcp.tool()
+    def get_historical_pit_stats(
+        season: Optional[int] = None,
+        team_name: Optional[str] = None,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        # Same row-budget ceiling as the sql_tools: past this the
+        # warehouse gives up top-K for a full sort.
+        limit = min(max(int(limit), 1), 5000)
+
+        conditions = ["pit_stop_count > 0", "avg_pit_stop_ms > 0"]
+        parameters = []
+        if season is not None:
+            conditions.append("season = :season")
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
+        if team_name:
+            conditions.append("teamName_lower LIKE :team_pat")
+            parameters.append(StatementParameterListItem(
+                name="team_pat", value=f"%{team_name.lower()}%"))
+
+        query = _PIT_STATS_SQL.format(where=" AND ".join(conditions))
+        parameters.append(StatementParameterListItem(
+            name="limit", value=str(int(limit)), type="INT"))
+
+        client = get_client()
+        return client.execute_query(query, parameters=parameters)
+
+    @mcp.tool()
+    def analyze_race_factors(
+        season: Optional[int] = None,
+    ) -> dict[str, Any]:
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        conditions = ["race_finish_position IS NOT NULL", "grid > 0"]
+        parameters = []
+        if season is not None:
+            conditions.append("season = :season")
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
+
+        where_clause = " AND ".join(conditions)
+
+        # All statistics are aggregated warehouse-side in a single pass;
+        # only one row of scalars crosses the wire.
+        query = f"""
+        SELECT
+            CORR(grid, race_finish_position) as grid_finish_correlation,
+            AVG(grid - race_finish_position) as avg_position_change,
+            AVG(CASE WHEN statusDescription <> 'Finished' THEN 1.0 ELSE 0.0 END) as dnf_rate,
+            AVG(avg_pit_stop_ms) as avg_pit_stop_ms,
+            COUNT(*) as sample_size
+        FROM f1.f1_gold_race_driver_features
+        WHERE {where_clause}
+        """
+
+        client = get_client()
+        result = client.execute_query(query, parameters=parameters)
+
+        if not result.get("success"):
+            return result
+
+        rows = result.get("rows", [])
+        if not rows or rows[0].get("sample_size") in (None, 0, "0"):
+            return {
+                "success": False,
+                "error": "No race data found for the specified criteria.",
+            }
+
+        row = rows[0]
+        correlation = float(row.get("grid_finish_correlation") or 0)
+        avg_change = float(row.get("avg_position_change") or 0)
+        dnf_rate = float(row.get("dnf_rate") or 0)
+        avg_pit_ms = float(row.get("avg_pit_stop_ms") or 0)
+        sample_size = int(row.get("sample_size") or 0)
+
+        insights = []
+        if correlation > 0.7:
+            insights.append(
+                "Grid position is a very strong predictor of finish position."
+            )
+        elif correlation > 0.4:
+            insights.append(
+                "Grid position moderately influences finish position."
+            )
+        else:
+            insights.append(
+                "Grid position has limited influence; races are unpredictable."
+            )
+
+        if dnf_rate > 0.2:
+            insights.append(
+                f"High DNF rate ({dnf_rate:.0%}) — reliability is a major factor."
+            )
+
+        if avg_change > 0:
+            insights.append(
+                f"Drivers gain {avg_change:.1f} positions on average from grid to finish."
+            )
+
+        return {
+            "success": True,
+            "season": season if season is not None else "all",
+            "analysis": {
+                "grid_finish_correlation": correlation,
+                "avg_position_change": avg_change,
+                "dnf_rate": dnf_rate,
+                "avg_pit_stop_ms": avg_pit_ms,
+                "sample_size": sample_size,
+            },
+            "insights": insights,
+        }
@@ -1,16 +1,24 @@
 """Schema discovery tools for MCP server."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 from fastmcp import FastMCP
 
 from f1_mcp.services.databricks_client import get_databricks_client
 from f1_mcp.utils.formatters import ResultFormatter
+from f1_mcp.utils.ttl_cache import ttl_cache, clear_ttl_caches
 from f1_mcp.config import get_settings
 
 
 def register_schema_tools(mcp: FastMCP) -> None:
+    # Closure-cell bindings of the singleton accessors (see
+    # register_sql_tools for rationale).
+    get_client = get_databricks_client
+    settings_factory = get_settings
+
     @mcp.tool()
+    @ttl_cache(maxsize=16, ttl_seconds=300)
     def list_f1_tables(
         include_bronze: bool = False,
         include_silver: bool = True,
@@ -28,33 +36,32 @@ def register_schema_tools(mcp: FastMCP) -> None:
         Returns:
             Dictionary with table names grouped by layer.
         """
-        client = get_databricks_client()
+        client = get_client()
 
-        layer_conditions = []
-        if include_bronze:
-            layer_conditions.append("table_name LIKE 'f1_bronze%'")
-        if include_silver:
-            layer_conditions.append("table_name LIKE 'f1_silver%'")
-        if include_gold:
-            layer_conditions.append("table_name LIKE 'f1_gold%'")
+        layers_requested = {
+            "bronze": include_bronze,
+            "silver": include_silver,
+            "gold": include_gold,
+        }
 
-        if not layer_conditions:
+        if not any(layers_requested.values()):
             return {
                 "success": False,
                 "error": "At least one layer must be included",
             }
 
-        layer_filter = " OR ".join(layer_conditions)
-        settings = get_settings()
+        settings = settings_factory()
 
+        # One prefix predicate server-side; the layer split is a single
+        # O(1) dispatch per row client-side.
         query = f"""
-        SELECT 
+        SELECT
             table_name,
             table_type,
             comment
         FROM {settings.databricks_catalog}.information_schema.tables
         WHERE table_schema = '{settings.databricks_schema}'
-          AND ({layer_filter})
+          AND table_name LIKE 'f1_%'
         ORDER BY table_name
         """
 
@@ -66,24 +73,26 @@ def register_schema_tools(mcp: FastMCP) -> None:
                 "silver": [],
                 "gold": [],
             }
+            kept_rows = []
 
             for row in result.get("rows", []):
                 table_name = row.get("table_name", "")
-                if "bronze" in table_name:
-                    tables_by_layer["bronze"].append(row)
-                elif "silver" in table_name:
-                    tables_by_layer["silver"].append(row)
-                elif "gold" in table_name:
-                    tables_by_layer["gold"].append(row)
+                layer = table_name.split("_", 2)[1] if table_name.startswith("f1_") else None
+                if layers_requested.get(layer):
+                    tables_by_layer[layer].append(row)
+                    kept_rows.append(row)
 
+            result["rows"] = kept_rows
+            result["row_count"] = len(kept_rows)
             result["tables_by_layer"] = tables_by_layer
 
         return result
 
     @mcp.tool()
+    @ttl_cache(maxsize=64, ttl_seconds=300)
     def describe_table(table_name: str) -> dict[str, Any]:
-        client = get_databricks_client()
-        settings = get_settings()
+        client = get_client()
+        settings = settings_factory()
 
         clean_name = table_name.split(".")[-1]
 
@@ -97,47 +106,56 @@ def register_schema_tools(mcp: FastMCP) -> None:
         return result
 
     @mcp.tool()
+    @ttl_cache(maxsize=64, ttl_seconds=300)
     def get_table_sample(
         table_name: str,
         limit: int = 5,
     ) -> dict[str, Any]:
         limit = min(limit, 20)
 
-        client = get_databricks_client()
+        client = get_client()
         return client.get_table_sample(table_name, limit)
 
     @mcp.tool()
+    @ttl_cache(maxsize=1, ttl_seconds=300)
     def get_f1_data_overview() -> dict[str, Any]:
-        client = get_databricks_client()
-
-        overview_query = """
-        SELECT 
-            'driver_season_stats' as table_name,
-            COUNT(*) as row_count,
-            MIN(season) as min_season,
-            MAX(season) as max_season
-        FROM f1.f1_gold_driver_season_stats
-
-        UNION ALL
-
-        SELECT 
-            'constructor_season_stats' as table_name,
-            COUNT(*) as row_count,
-            MIN(season) as min_season,
-            MAX(season) as max_season
-        FROM f1.f1_gold_constructor_season_stats
-
-        UNION ALL
-
-        SELECT 
-            'race_driver_features' as table_name,
-            COUNT(*) as row_count,
-            MIN(season) as min_season,
-            MAX(season) as max_season
-        FROM f1.f1_gold_race_driver_features
-        """
-
-        result = client.execute_query(overview_query)
+        client = get_client()
+
+        # Three independent scans; issuing them concurrently overlaps
+        # warehouse execution so the tool waits max(t_i), not sum(t_i).
+        overview_queries = [
+            f"""
+            SELECT
+                '{label}' as table_name,
+                COUNT(*) as row_count,
+                MIN(season) as min_season,
+                MAX(season) as max_season
+            FROM f1.f1_gold_{label}
+            """
+            for label in (
+                "driver_season_stats",
+                "constructor_season_stats",
+                "race_driver_features",
+            )
+        ]
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            partials = list(pool.map(client.execute_query, overview_queries))
+
+        rows = []
+        columns = []
+        for partial in partials:
+            if not partial.get("success"):
+                return partial
+            columns = partial.get("columns", columns)
+            rows.extend(partial.get("rows", []))
+
+        result = {
+            "success": True,
+            "columns": columns,
+            "rows": rows,
+            "row_count": len(rows),
+        }
 
         if result.get("success"):
             result["description"] = {
@@ -172,3 +190,12 @@ def register_schema_tools(mcp: FastMCP) -> None:
 
         return result
 
+    @mcp.tool()
+    def clear_schema_cache() -> dict[str, Any]:
+        """Drop cached schema/overview results after a migration."""
+        cleared = clear_ttl_caches()
+        return {
+            "success": True,
+            "caches_cleared": cleared,
+        }
+
@@ -1,5 +1,7 @@
 """SQL query execution tools for MCP server."""
 
+import asyncio
+import time
 from typing import Any, Optional
 
 from fastmcp import FastMCP
@@ -8,56 +10,74 @@ from f1_mcp.services.databricks_client import get_databricks_client
 from f1_mcp.utils.validators import get_sql_validator
 from f1_mcp.utils.formatters import ResultFormatter
 
+# Upper bound on warehouse statements in flight across all async tool
+# handlers; independent tool calls overlap up to this limit.
+_WAREHOUSE_SEMAPHORE = asyncio.Semaphore(8)
 
-def register_sql_tools(mcp: FastMCP) -> None:
-    @mcp.tool()
-    def query_f1_data(
-        query: str,
-        max_rows: Optional[int] = None,
-        format: str = "json",
-    ) -> dict[str, Any]:
-        validator = get_sql_validator()
-        validation = validator.validate_query(query)
 
-        if not validation.is_valid:
-            return {
-                "success": False,
-                "error": validation.error_message,
-            }
+async def _in_thread(func, /, *args: Any, **kwargs: Any):
+    """Run a blocking client call in a worker thread.
 
-        client = get_databricks_client()
-        result = client.execute_query(query, max_rows=max_rows or 1000)
+    Keeps the event loop free while the warehouse round-trip is in
+    flight, so FastMCP can serve other tool calls concurrently.
+    """
+    async with _WAREHOUSE_SEMAPHORE:
+        return await asyncio.to_thread(func, *args, **kwargs)
 
-        if format == "markdown" and result.get("success"):
-            result["formatted"] = ResultFormatter.format_as_markdown_table(result)
-        elif format == "text" and result.get("success"):
-            result["formatted"] = ResultFormatter.format_query_result(result)
 
-        return result
+# Short-lived cache of successful query results, keyed per tool on its
+# filter arguments, so an agent re-asking the same question within a
+# conversation skips the warehouse round-trip. Failures are never
+# stored, so transient errors retry immediately. (The shared ttl_cache
+# decorator is not used here: it cannot skip failed results.)
+_RESULT_CACHE: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_RESULT_CACHE_MAX = 512
+_RESULT_CACHE_TTL = 300.0
+
+
+def _cache_get(key: tuple) -> Optional[dict[str, Any]]:
+    entry = _RESULT_CACHE.get(key)
+    if entry is None:
+        return None
+    expires, result = entry
+    if time.monotonic() >= expires:
+        del _RESULT_CACHE[key]
+        return None
+    return result
 
-    @mcp.tool()
-    def get_driver_season_stats(
-        driver_name: Optional[str] = None,
-        season: Optional[int] = None,
-        team_name: Optional[str] = None,
-        limit: int = 50,
-    ) -> dict[str, Any]:
-        conditions = []
-        if driver_name:
-            safe_name = driver_name.replace("'", "''")
-            conditions.append(f"LOWER(driverName) LIKE LOWER('%{safe_name}%')")
-        if season:
-            conditions.append(f"season = {int(season)}")
-        if team_name:
-            safe_team = team_name.replace("'", "''")
-            conditions.append(f"LOWER(teamName) LIKE LOWER('%{safe_team}%')")
 
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
+def _cache_put(key: tuple, result: dict[str, Any]) -> None:
+    if not result.get("success"):
+        return
+    if len(_RESULT_CACHE) >= _RESULT_CACHE_MAX:
+        # Drop the oldest insertion; dicts preserve insertion order.
+        del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+    _RESULT_CACHE[key] = (time.monotonic() + _RESULT_CACHE_TTL, result)
 
-        query = f"""
-        SELECT 
+
+# Rows fetched for the shared per-season entry behind season-only
+# stats lookups; comfortably covers a full grid of drivers or teams.
+_SEASON_CACHE_ROWS = 200
+
+# Hard ceiling on caller-supplied row budgets. Beyond this the
+# warehouse falls back from top-K to a full sort and the payload stops
+# being useful to an agent anyway.
+_MAX_ROWS = 5000
+
+
+def _clamp_limit(value: Optional[int], default: int) -> int:
+    """Clamp a caller-supplied limit/max_rows to [1, _MAX_ROWS]."""
+    if value is None:
+        value = default
+    return min(max(int(value), 1), _MAX_ROWS)
+
+
+# Invariant SQL bodies, built once at import. Tool bodies only fill in
+# the dynamic WHERE fragment; everything else (including LIMIT, which is
+# a bound parameter) is constant across calls. The ranked tools read
+# the pre-sorted materialized views from sql/materialized_views.sql.
+_DRIVER_STATS_SQL = """
+        SELECT
             season,
             driverName,
             teamName,
@@ -69,34 +89,14 @@ def register_sql_tools(mcp: FastMCP) -> None:
             avg_grid_position,
             avg_finish_position,
             final_champ_position
-        FROM f1.f1_gold_driver_season_stats
-        {where_clause}
+        FROM f1.mv_driver_season_stats_ranked
+        {where}
         ORDER BY season DESC, total_points DESC
-        LIMIT {limit}
+        LIMIT :limit
         """
 
-        client = get_databricks_client()
-        return client.execute_query(query)
-
-    @mcp.tool()
-    def get_constructor_season_stats(
-        team_name: Optional[str] = None,
-        season: Optional[int] = None,
-        limit: int = 50,
-    ) -> dict[str, Any]:
-        conditions = []
-        if team_name:
-            safe_team = team_name.replace("'", "''")
-            conditions.append(f"LOWER(teamName) LIKE LOWER('%{safe_team}%')")
-        if season:
-            conditions.append(f"season = {int(season)}")
-
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
-
-        query = f"""
-        SELECT 
+_CONSTRUCTOR_STATS_SQL = """
+        SELECT
             season,
             teamName,
             teamNationality,
@@ -106,38 +106,14 @@ def register_sql_tools(mcp: FastMCP) -> None:
             podiums,
             dnf_count,
             final_cons_position
-        FROM f1.f1_gold_constructor_season_stats
-        {where_clause}
+        FROM f1.mv_constructor_season_stats_ranked
+        {where}
         ORDER BY season DESC, team_total_points DESC
-        LIMIT {limit}
+        LIMIT :limit
         """
 
-        client = get_databricks_client()
-        return client.execute_query(query)
-
-    @mcp.tool()
-    def get_race_results(
-        race_name: Optional[str] = None,
-        season: Optional[int] = None,
-        driver_name: Optional[str] = None,
-        limit: int = 100,
-    ) -> dict[str, Any]:
-        conditions = []
-        if race_name:
-            safe_race = race_name.replace("'", "''")
-            conditions.append(f"LOWER(raceName) LIKE LOWER('%{safe_race}%')")
-        if season:
-            conditions.append(f"season = {int(season)}")
-        if driver_name:
-            safe_name = driver_name.replace("'", "''")
-            conditions.append(f"LOWER(driverName) LIKE LOWER('%{safe_name}%')")
-
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
-
-        query = f"""
-        SELECT 
+_RACE_RESULTS_SQL = """
+        SELECT
             season,
             round,
             raceName,
@@ -151,38 +127,53 @@ def register_sql_tools(mcp: FastMCP) -> None:
             pit_stop_count,
             avg_pit_stop_ms,
             statusDescription
-        FROM f1.f1_gold_race_driver_features
-        {where_clause}
+        FROM f1.mv_race_results_ranked
+        {where}
         ORDER BY season DESC, round DESC, race_finish_position
-        LIMIT {limit}
+        LIMIT :limit
         """
 
-        client = get_databricks_client()
-        return client.execute_query(query)
-
-    @mcp.tool()
-    def get_pit_stop_data(
-        season: Optional[int] = None,
-        driver_name: Optional[str] = None,
-        team_name: Optional[str] = None,
-        limit: int = 500,
-    ) -> dict[str, Any]:
-        conditions = []
-        if season:
-            conditions.append(f"season = {int(season)}")
-        if driver_name:
-            safe_name = driver_name.replace("'", "''")
-            conditions.append(f"LOWER(driverName) LIKE LOWER('%{safe_name}%')")
-        if team_name:
-            safe_team = team_name.replace("'", "''")
-            conditions.append(f"LOWER(teamName) LIKE LOWER('%{safe_team}%')")
-
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
+# Driver and constructor standings for one season in a single round
+# trip; the kind column is the discriminator used to split the rows
+# client-side. Both branches project the same shape.
+_SEASON_BUNDLE_SQL = """
+        WITH d AS (
+            SELECT
+                'driver' AS kind,
+                season,
+                driverName AS name,
+                teamName AS team,
+                total_points AS points,
+                wins,
+                podiums,
+                final_champ_position AS championship_position
+            FROM f1.mv_driver_season_stats_ranked
+            WHERE season = :season
+            ORDER BY total_points DESC
+            LIMIT :limit
+        ),
+        c AS (
+            SELECT
+                'constructor' AS kind,
+                season,
+                teamName AS name,
+                CAST(NULL AS STRING) AS team,
+                team_total_points AS points,
+                wins,
+                podiums,
+                final_cons_position AS championship_position
+            FROM f1.mv_constructor_season_stats_ranked
+            WHERE season = :season
+            ORDER BY team_total_points DESC
+            LIMIT :limit
+        )
+        SELECT * FROM d
+        UNION ALL
+        SELECT * FROM c
+        """
 
-        query = f"""
-        SELECT 
+_PIT_STOP_SQL = """
+        SELECT
             season,
             raceName,
             driverName,
@@ -192,12 +183,528 @@ def register_sql_tools(mcp: FastMCP) -> None:
             total_pit_stop_ms,
             race_finish_position
         FROM f1.f1_gold_race_driver_features
-        {where_clause}
-        AND pit_stop_count > 0
+        {where}
         ORDER BY season DESC, avg_pit_stop_ms
-        LIMIT {limit}
+        LIMIT :limit
+        """
+
+
+def _query_variants(
+    template: str,
+    conditions: tuple[str, ...],
+    base: tuple[str, ...] = (),
+) -> tuple[str, ...]:
+    """Fill a template with every WHERE shape its filters can produce.
+
+    Index i of the result is the full query for the bitmask where bit n
+    set means conditions[n] is present; base predicates appear in every
+    variant. Precomputing all 2**n shapes at import keeps the statement
+    text byte-identical across calls with the same filters, which is
+    what the warehouse plan cache keys on.
+    """
+    variants = []
+    for mask in range(1 << len(conditions)):
+        chosen = list(base)
+        chosen += [c for i, c in enumerate(conditions) if mask >> i & 1]
+        where = "WHERE " + " AND ".join(chosen) if chosen else ""
+        variants.append(template.format(where=where))
+    return tuple(variants)
+
+
+_DRIVER_CONDITIONS = (
+    "driverName_lower LIKE :driver_pat",
+    "season = :season",
+    "teamName_lower LIKE :team_pat",
+)
+_DRIVER_QUERIES = _query_variants(_DRIVER_STATS_SQL, _DRIVER_CONDITIONS)
+
+_CONSTRUCTOR_CONDITIONS = (
+    "teamName_lower LIKE :team_pat",
+    "season = :season",
+)
+_CONSTRUCTOR_QUERIES = _query_variants(
+    _CONSTRUCTOR_STATS_SQL, _CONSTRUCTOR_CONDITIONS)
+
+_RACE_CURSOR_CONDITION = (
+    "(season < :cur_season"
+    " OR (season = :cur_season AND round < :cur_round)"
+    " OR (season = :cur_season AND round = :cur_round"
+    " AND race_finish_position > :cur_pos))"
+)
+_RACE_CONDITIONS = (
+    "raceName_lower LIKE :race_pat",
+    "season = :season",
+    "driverName_lower LIKE :driver_pat",
+    _RACE_CURSOR_CONDITION,
+)
+_RACE_QUERIES = _query_variants(_RACE_RESULTS_SQL, _RACE_CONDITIONS)
+
+_PIT_CURSOR_CONDITION = (
+    "(season < :cur_season"
+    " OR (season = :cur_season"
+    " AND avg_pit_stop_ms > :cur_pit_ms))"
+)
+_PIT_CONDITIONS = (
+    "season = :season",
+    "driverName_lower LIKE :driver_pat",
+    "teamName_lower LIKE :team_pat",
+    _PIT_CURSOR_CONDITION,
+)
+_PIT_QUERIES = _query_variants(
+    _PIT_STOP_SQL, _PIT_CONDITIONS, base=("pit_stop_count > 0",))
+
+
+def register_sql_tools(mcp: FastMCP) -> None:
+    # Resolve the singleton accessors once; tool bodies then read a
+    # closure cell per call instead of doing a global dict lookup. The
+    # client stays behind its accessor so construction is deferred to
+    # first use; the validator is stateless and cheap, so the instance
+    # itself is bound and tool bodies skip even the accessor call.
+    get_client = get_databricks_client
+    validator = get_sql_validator()
+
+    async def _season_only_stats(
+        query: str,
+        kind: str,
+        season: int,
+        limit: int,
+    ) -> dict[str, Any]:
+        """Serve a season-only stats lookup from one shared fetch.
+
+        "Summarize season X" is the dominant call shape; rather than
+        caching per (season, limit) pair, fetch _SEASON_CACHE_ROWS rows
+        once per season and slice to each caller's limit, so every
+        variation of the same question hits the one entry.
         """
+        key = (kind, int(season))
+        cached = _cache_get(key)
+        if cached is None:
+            from databricks.sdk.service.sql import StatementParameterListItem
+
+            parameters = [
+                StatementParameterListItem(
+                    name="season", value=str(int(season)), type="INT"),
+                StatementParameterListItem(
+                    name="limit", value=str(_SEASON_CACHE_ROWS), type="INT"),
+            ]
+            client = get_client()
+            result = await _in_thread(
+                client.execute_query, query, parameters=parameters)
+            if not result.get("success"):
+                return result
+            _cache_put(key, result)
+            cached = result
+
+        rows = cached.get("rows", [])[:limit]
+        return {
+            "success": True,
+            "columns": cached.get("columns", []),
+            "rows": rows,
+            "row_count": len(rows),
+        }
+
+    @mcp.tool()
+    async def query_f1_data(
+        query: str,
+        max_rows: Optional[int] = None,
+        format: str = "json",
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        client = get_client()
+        max_rows = _clamp_limit(max_rows, 1000)
+
+        if cursor:
+            # Continuation of an already-validated, already-executed
+            # statement; fetch the next result chunk directly.
+            result = await _in_thread(client.execute_query_paged, cursor=cursor)
+        elif format in ("markdown", "text"):
+            validation = validator.validate_query(query)
+
+            if not validation.is_valid:
+                return {
+                    "success": False,
+                    "error": validation.error_message,
+                }
+
+            # Rendered formats never need the raw row payload; stream
+            # the result chunk by chunk into the formatter so peak
+            # memory stays at one chunk instead of the full result.
+            def _render() -> tuple[str, int]:
+                batches = client.stream_query(query, max_rows=max_rows)
+                if format == "markdown":
+                    return ResultFormatter.format_markdown_stream(batches)
+                return ResultFormatter.format_text_stream(batches)
+
+            try:
+                formatted, total = await _in_thread(_render)
+            except RuntimeError as e:
+                return {
+                    "success": False,
+                    "error": str(e),
+                }
+            return {
+                "success": True,
+                "row_count": total,
+                "formatted": formatted,
+            }
+        else:
+            # Key on the whitespace-normalized statement so trivial
+            # reformattings of the same query still hit the cache. The
+            # formatted rendering is applied after the cache, so one
+            # entry serves every output format.
+            key = ("adhoc", " ".join(query.split()),
+                   max_rows, format == "columns")
+            cached = _cache_get(key)
+            if cached is not None:
+                result = dict(cached)
+            else:
+                validation = validator.validate_query(query)
+
+                if not validation.is_valid:
+                    return {
+                        "success": False,
+                        "error": validation.error_message,
+                    }
 
-        client = get_databricks_client()
-        return client.execute_query(query)
+                if format == "columns":
+                    # Columnar payload: column names once plus one value
+                    # list per column, instead of one dict per row. Much
+                    # smaller on the wire for wide results; not paged.
+                    result = await _in_thread(
+                        client.execute_query, query,
+                        max_rows=max_rows,
+                        return_format="columns",
+                    )
+                else:
+                    result = await _in_thread(
+                        client.execute_query_paged, query,
+                        max_rows=max_rows,
+                    )
+                _cache_put(key, result)
+                if result.get("success"):
+                    result = dict(result)
+
+        if format == "markdown" and result.get("success"):
+            result["formatted"] = ResultFormatter.format_as_markdown_table(result)
+        elif format == "text" and result.get("success"):
+            result["formatted"] = ResultFormatter.format_query_result(result)
+
+        return result
+
+    @mcp.tool()
+    async def query_batch(
+        queries: list[str],
+        max_rows: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Run several read-only SQL queries concurrently.
+
+        All statements are validated up front; execution overlaps up to
+        the shared warehouse concurrency limit, so the batch completes
+        in roughly the time of its slowest member. Results come back in
+        input order.
+        """
+        if not queries:
+            return {
+                "success": False,
+                "error": "queries must not be empty",
+            }
+
+        max_rows = _clamp_limit(max_rows, 1000)
+
+        for query in queries:
+            validation = validator.validate_query(query)
+            if not validation.is_valid:
+                return {
+                    "success": False,
+                    "error": validation.error_message,
+                }
+
+        client = get_client()
+        results = await asyncio.gather(*(
+            _in_thread(client.execute_query, query, max_rows=max_rows)
+            for query in queries
+        ))
+
+        return {
+            "success": all(r.get("success") for r in results),
+            "results": list(results),
+        }
+
+    @mcp.tool()
+    async def get_driver_season_stats(
+        driver_name: Optional[str] = None,
+        season: Optional[int] = None,
+        team_name: Optional[str] = None,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        limit = _clamp_limit(limit, 50)
+        if season is not None and not driver_name and not team_name:
+            return await _season_only_stats(
+                _DRIVER_QUERIES[2], "driver_season", season, limit)
+
+        key = ("driver_stats", driver_name, season, team_name, limit)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        mask = 0
+        parameters = []
+        if driver_name:
+            mask |= 1
+            parameters.append(StatementParameterListItem(
+                name="driver_pat", value=f"%{driver_name.lower()}%"))
+        if season is not None:
+            mask |= 2
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
+        if team_name:
+            mask |= 4
+            parameters.append(StatementParameterListItem(
+                name="team_pat", value=f"%{team_name.lower()}%"))
+
+        query = _DRIVER_QUERIES[mask]
+        parameters.append(StatementParameterListItem(
+            name="limit", value=str(int(limit)), type="INT"))
+
+        client = get_client()
+        result = await _in_thread(
+            client.execute_query, query, parameters=parameters)
+        _cache_put(key, result)
+        return result
+
+    @mcp.tool()
+    async def get_constructor_season_stats(
+        team_name: Optional[str] = None,
+        season: Optional[int] = None,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        limit = _clamp_limit(limit, 50)
+        if season is not None and not team_name:
+            return await _season_only_stats(
+                _CONSTRUCTOR_QUERIES[2], "constructor_season", season, limit)
+
+        key = ("constructor_stats", team_name, season, limit)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        mask = 0
+        parameters = []
+        if team_name:
+            mask |= 1
+            parameters.append(StatementParameterListItem(
+                name="team_pat", value=f"%{team_name.lower()}%"))
+        if season is not None:
+            mask |= 2
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
+
+        query = _CONSTRUCTOR_QUERIES[mask]
+        parameters.append(StatementParameterListItem(
+            name="limit", value=str(int(limit)), type="INT"))
+
+        client = get_client()
+        result = await _in_thread(
+            client.execute_query, query, parameters=parameters)
+        _cache_put(key, result)
+        return result
+
+    @mcp.tool()
+    async def get_season_bundle(
+        season: int,
+        limit: int = 20,
+    ) -> dict[str, Any]:
+        """Get driver and constructor standings for a season in one query.
+
+        Covers the common "tell me about season Y" pattern with a
+        single warehouse round trip instead of two.
+        """
+        limit = _clamp_limit(limit, 20)
+        key = ("season_bundle", season, limit)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        parameters = [
+            StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"),
+            StatementParameterListItem(
+                name="limit", value=str(int(limit)), type="INT"),
+        ]
+
+        client = get_client()
+        result = await _in_thread(
+            client.execute_query, _SEASON_BUNDLE_SQL, parameters=parameters)
+
+        if not result.get("success"):
+            return result
+
+        drivers = []
+        constructors = []
+        for row in result.get("rows", []):
+            if row.pop("kind", None) == "driver":
+                drivers.append(row)
+            else:
+                constructors.append(row)
+
+        result = {
+            "success": True,
+            "season": season,
+            "drivers": drivers,
+            "constructors": constructors,
+        }
+        _cache_put(key, result)
+        return result
+
+    @mcp.tool()
+    async def get_race_results(
+        race_name: Optional[str] = None,
+        season: Optional[int] = None,
+        driver_name: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[dict] = None,
+    ) -> dict[str, Any]:
+        cursor_key = None
+        if cursor:
+            cursor_key = (
+                cursor.get("season"),
+                cursor.get("round"),
+                cursor.get("race_finish_position"),
+            )
+            if None in cursor_key:
+                return {
+                    "success": False,
+                    "error": (
+                        "cursor must contain season, round and "
+                        "race_finish_position"
+                    ),
+                }
+
+        limit = _clamp_limit(limit, 100)
+        key = ("race_results", race_name, season, driver_name, limit,
+               cursor_key)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        mask = 0
+        parameters = []
+        if race_name:
+            mask |= 1
+            parameters.append(StatementParameterListItem(
+                name="race_pat", value=f"%{race_name.lower()}%"))
+        if season is not None:
+            mask |= 2
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
+        if driver_name:
+            mask |= 4
+            parameters.append(StatementParameterListItem(
+                name="driver_pat", value=f"%{driver_name.lower()}%"))
+        if cursor_key:
+            # Keyset continuation matching the ORDER BY (season DESC,
+            # round DESC, race_finish_position ASC); see
+            # _RACE_CURSOR_CONDITION.
+            mask |= 8
+            parameters.append(StatementParameterListItem(
+                name="cur_season", value=str(int(cursor_key[0])), type="INT"))
+            parameters.append(StatementParameterListItem(
+                name="cur_round", value=str(int(cursor_key[1])), type="INT"))
+            parameters.append(StatementParameterListItem(
+                name="cur_pos", value=str(int(cursor_key[2])), type="INT"))
+
+        query = _RACE_QUERIES[mask]
+        parameters.append(StatementParameterListItem(
+            name="limit", value=str(int(limit)), type="INT"))
+
+        client = get_client()
+        result = await _in_thread(
+            client.execute_query, query, parameters=parameters)
+        if result.get("success") and result.get("rows"):
+            last = result["rows"][-1]
+            result["next_cursor"] = {
+                "season": last.get("season"),
+                "round": last.get("round"),
+                "race_finish_position": last.get("race_finish_position"),
+            }
+        _cache_put(key, result)
+        return result
+
+    @mcp.tool()
+    async def get_pit_stop_data(
+        season: Optional[int] = None,
+        driver_name: Optional[str] = None,
+        team_name: Optional[str] = None,
+        limit: int = 500,
+        cursor: Optional[dict] = None,
+    ) -> dict[str, Any]:
+        cursor_key = None
+        if cursor:
+            cursor_key = (
+                cursor.get("season"),
+                cursor.get("avg_pit_stop_ms"),
+            )
+            if None in cursor_key:
+                return {
+                    "success": False,
+                    "error": "cursor must contain season and avg_pit_stop_ms",
+                }
+
+        limit = _clamp_limit(limit, 500)
+        key = ("pit_stops", season, driver_name, team_name, limit, cursor_key)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        # Every variant carries the pit_stop_count > 0 base predicate,
+        # so a WHERE clause is always present.
+        mask = 0
+        parameters = []
+        if season is not None:
+            mask |= 1
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
+        if driver_name:
+            mask |= 2
+            parameters.append(StatementParameterListItem(
+                name="driver_pat", value=f"%{driver_name.lower()}%"))
+        if team_name:
+            mask |= 4
+            parameters.append(StatementParameterListItem(
+                name="team_pat", value=f"%{team_name.lower()}%"))
+        if cursor_key:
+            # Keyset continuation matching the ORDER BY (season DESC,
+            # avg_pit_stop_ms ASC); see _PIT_CURSOR_CONDITION.
+            mask |= 8
+            parameters.append(StatementParameterListItem(
+                name="cur_season", value=str(int(cursor_key[0])), type="INT"))
+            parameters.append(StatementParameterListItem(
+                name="cur_pit_ms", value=str(float(cursor_key[1])),
+                type="DOUBLE"))
+
+        query = _PIT_QUERIES[mask]
+        parameters.append(StatementParameterListItem(
+            name="limit", value=str(int(limit)), type="INT"))
+
+        client = get_client()
+        result = await _in_thread(
+            client.execute_query, query, parameters=parameters)
+        if result.get("success") and result.get("rows"):
+            last = result["rows"][-1]
+            result["next_cursor"] = {
+                "season": last.get("season"),
+                "avg_pit_stop_ms": last.get("avg_pit_stop_ms"),
+            }
+        _cache_put(key, result)
+        return result
 
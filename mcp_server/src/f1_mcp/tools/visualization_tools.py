@@ -1,23 +1,209 @@
 """Visualization tools for MCP server."""
 
 import base64
+import functools
 import os
-from datetime import datetime
+import time
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
 from fastmcp import FastMCP
 
-from f1_mcp.services.databricks_client import get_databricks_client
-from f1_mcp.services.chart_service import get_chart_service
 
 
 CHARTS_OUTPUT_DIR = Path("./f1_charts")
 
+# Filename / listing timestamp formats, bound once; time.strftime on a
+# struct_time skips the datetime object each save would otherwise build.
+_TS_FMT = "%Y%m%d_%H%M%S"
+_ISO_FMT = "%Y-%m-%dT%H:%M:%S"
+
+
+# Invariant SQL bodies, built once at import (see sql_tools for the
+# same pattern). Metric names are whitelist-validated before they are
+# interpolated; the driver-performance variants are precomputed since
+# the metric is the only thing that changes their text.
+_DRIVER_METRICS = (
+    "total_points", "wins", "podiums",
+    "avg_finish_position", "dnf_count", "races_count",
+)
+
+_DRIVER_PERFORMANCE_SQL = """
+        SELECT
+            season,
+            driverName,
+            teamName,
+            {metric}
+        FROM f1.f1_gold_driver_season_stats
+        WHERE LOWER(driverName) LIKE :driver_pat
+        ORDER BY season
+        """
+
+_DRIVER_PERFORMANCE_QUERIES = {
+    metric: _DRIVER_PERFORMANCE_SQL.format(metric=metric)
+    for metric in _DRIVER_METRICS
+}
+
+_DRIVER_PERFORMANCE_BATCH_SQL = """
+        SELECT
+            season,
+            driverName,
+            teamName,
+            {metric}
+        FROM f1.f1_gold_driver_season_stats
+        WHERE ({driver_conditions})
+        ORDER BY driverName, season
+        """
+
+_TEAM_METRICS = ("team_total_points", "wins", "podiums", "dnf_count")
+
+_TEAM_COMPARISON_SQL = """
+        SELECT
+            season,
+            teamName,
+            {metric}
+        FROM f1.f1_gold_constructor_season_stats
+        WHERE ({team_conditions})
+        {season_filter}
+        ORDER BY season, teamName
+        """
+
+_PIT_ANALYSIS_SQL = """
+        SELECT
+            teamName,
+            avg_pit_stop_ms,
+            pit_stop_count,
+            race_finish_position
+        FROM f1.f1_gold_race_driver_features
+        WHERE {where}
+        ORDER BY teamName
+        LIMIT 1000
+        """
+
+_CORRELATION_SQL = """
+        SELECT {aggregates}
+        FROM f1.f1_gold_race_driver_features
+        WHERE race_finish_position IS NOT NULL
+        {season_filter}
+        """
+
+_DRIVER_STANDINGS_SQL = """
+        SELECT
+            driverName as name,
+            total_points as points,
+            wins,
+            final_champ_position as position
+        FROM f1.f1_gold_driver_season_stats
+        WHERE season = :season
+        ORDER BY total_points DESC
+        LIMIT :limit
+        """
+
+_CONSTRUCTOR_STANDINGS_SQL = """
+        SELECT
+            teamName as name,
+            team_total_points as points,
+            wins,
+            final_cons_position as position
+        FROM f1.f1_gold_constructor_season_stats
+        WHERE season = :season
+        ORDER BY team_total_points DESC
+        LIMIT :limit
+        """
+
+
+# Short-lived cache of successful chart responses keyed on the tool's
+# arguments: a repeated identical call skips both the warehouse round
+# trip and the matplotlib render, the two dominant costs here. Same
+# shape as the sql_tools result cache; failures are never stored.
+_CHART_CACHE: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_CHART_CACHE_MAX = 64
+_CHART_CACHE_TTL = 300.0
+
+
+def _freeze(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _cached_chart(fn):
+    """Serve repeated chart tool calls from _CHART_CACHE."""
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        key = (fn.__name__,
+               tuple(_freeze(a) for a in args),
+               tuple((k, _freeze(v)) for k, v in sorted(kwargs.items())))
+        entry = _CHART_CACHE.get(key)
+        if entry is not None:
+            expires, cached = entry
+            if time.monotonic() < expires:
+                return cached
+            del _CHART_CACHE[key]
+
+        result = fn(*args, **kwargs)
+        if result.get("success"):
+            if len(_CHART_CACHE) >= _CHART_CACHE_MAX:
+                del _CHART_CACHE[next(iter(_CHART_CACHE))]
+            _CHART_CACHE[key] = (time.monotonic() + _CHART_CACHE_TTL, result)
+        return result
+    return wrapper
+
+
+def _float_column(arrays: dict[str, Any], name: str):
+    """Dense float64 view of a result column; NULLs become NaN.
+
+    Columns with NULLs come back from the client as object arrays; this
+    converts them once so the chart math stays in NumPy.
+    """
+    import numpy as np
+
+    arr = arrays[name]
+    if arr.dtype.kind in "if":
+        return arr.astype(np.float64, copy=False)
+    return np.asarray(
+        [float(v) if v is not None else np.nan for v in arr],
+        dtype=np.float64,
+    )
+
+
+@functools.cache
+def _get_client():
+    """Process-wide Databricks client, resolved on first use.
+
+    The import stays deferred so loading this module costs nothing,
+    but after the first chart every tool call skips both the import
+    lookup and the singleton accessor.
+    """
+    from f1_mcp.services.databricks_client import get_databricks_client
+
+    return get_databricks_client()
+
+
+@functools.cache
+def _get_chart_service():
+    """Process-wide chart service, resolved on first use (see above)."""
+    from f1_mcp.services.chart_service import get_chart_service
+
+    return get_chart_service()
+
+
+def _write_image(file_path: Path, data: bytes) -> None:
+    """Write decoded PNG bytes with one unbuffered syscall.
+
+    Skipping the buffered file object avoids an extra copy of the
+    multi-megabyte image buffer on every save.
+    """
+    fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 
 def register_visualization_tools(mcp: FastMCP) -> None:
     def _save_chart_if_requested(
-        chart_base64: str,
+        png_bytes: bytes,
         save_to_file: bool,
         filename: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
@@ -28,18 +214,14 @@ def register_visualization_tools(mcp: FastMCP) -> None:
             CHARTS_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
             
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"f1_chart_{timestamp}"
+                filename = f"f1_chart_{time.strftime(_TS_FMT)}"
             
             if not filename.endswith(".png"):
                 filename = f"{filename}.png"
             
             file_path = CHARTS_OUTPUT_DIR / filename
-            image_data = base64.b64decode(chart_base64)
-            
-            with open(file_path, "wb") as f:
-                f.write(image_data)
-            
+            _write_image(file_path, png_bytes)
+
             return {
                 "saved": True,
                 "file_path": str(file_path),
@@ -51,6 +233,7 @@ def register_visualization_tools(mcp: FastMCP) -> None:
             }
 
     @mcp.tool()
+    @_cached_chart
     def chart_driver_performance(
         driver_name: str,
         metric: str = "total_points",
@@ -58,47 +241,41 @@ def register_visualization_tools(mcp: FastMCP) -> None:
         save_to_file: bool = True,
         filename: Optional[str] = None,
     ) -> dict[str, Any]:
-        valid_metrics = [
-            "total_points", "wins", "podiums", 
-            "avg_finish_position", "dnf_count", "races_count"
-        ]
-        if metric not in valid_metrics:
+        query = _DRIVER_PERFORMANCE_QUERIES.get(metric)
+        if query is None:
             return {
                 "success": False,
-                "error": f"Invalid metric. Choose from: {', '.join(valid_metrics)}",
+                "error": f"Invalid metric. Choose from: {', '.join(_DRIVER_METRICS)}",
             }
 
-        client = get_databricks_client()
-        safe_name = driver_name.replace("'", "''")
+        from databricks.sdk.service.sql import StatementParameterListItem
 
-        query = f"""
-        SELECT 
-            season,
-            driverName,
-            teamName,
-            {metric}
-        FROM f1.f1_gold_driver_season_stats
-        WHERE LOWER(driverName) LIKE LOWER('%{safe_name}%')
-        ORDER BY season
-        """
+        client = _get_client()
 
-        result = client.execute_query(query)
+        result = client.execute_query(
+            query,
+            parameters=[StatementParameterListItem(
+                name="driver_pat", value=f"%{driver_name.lower()}%")],
+            return_format="numpy",
+        )
 
         if not result.get("success"):
             return result
 
-        rows = result.get("rows", [])
-        if not rows:
+        if not result.get("row_count"):
             return {
                 "success": False,
                 "error": f"No data found for driver matching '{driver_name}'",
             }
 
-        actual_driver_name = rows[0].get("driverName", driver_name)
-        seasons = [r.get("season") for r in rows]
-        values = [float(r.get(metric, 0) or 0) for r in rows]
+        import numpy as np
 
-        chart_service = get_chart_service()
+        arrays = result["arrays"]
+        actual_driver_name = str(arrays["driverName"][0]) or driver_name
+        seasons = arrays["season"].tolist()
+        values = np.nan_to_num(_float_column(arrays, metric)).tolist()
+
+        chart_service = _get_chart_service()
 
         if chart_type == "line":
             chart_result = chart_service.create_line_chart(
@@ -117,9 +294,8 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                 ylabel=metric.replace("_", " ").title(),
             )
 
-        chart_dict = chart_result.to_dict()
         save_result = _save_chart_if_requested(
-            chart_dict["chart_base64"],
+            chart_result.png_bytes,
             save_to_file,
             filename or f"{actual_driver_name.replace(' ', '_')}_{metric}",
         )
@@ -129,20 +305,128 @@ def register_visualization_tools(mcp: FastMCP) -> None:
             "driver": actual_driver_name,
             "metric": metric,
             "seasons_covered": [min(seasons), max(seasons)],
-            "chart_type": chart_dict["chart_type"],
-            "title": chart_dict["title"],
-            "description": chart_dict["description"],
-            "data_summary": chart_dict["data_summary"],
+            "chart_type": chart_result.chart_type,
+            "title": chart_result.title,
+            "description": chart_result.description,
+            "data_summary": chart_result.data_summary,
         }
         
         if save_result:
             response.update(save_result)
         else:
-            response["chart_base64"] = chart_dict["chart_base64"]
+            response["chart_base64"] = chart_result.chart_base64
         
         return response
 
     @mcp.tool()
+    @_cached_chart
+    def chart_driver_performance_batch(
+        driver_names: list[str],
+        metric: str = "total_points",
+        save_to_file: bool = True,
+    ) -> dict[str, Any]:
+        if not driver_names:
+            return {
+                "success": False,
+                "error": "Please provide at least 1 driver name.",
+            }
+
+        if metric not in _DRIVER_PERFORMANCE_QUERIES:
+            return {
+                "success": False,
+                "error": f"Invalid metric. Choose from: {', '.join(_DRIVER_METRICS)}",
+            }
+
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        client = _get_client()
+
+        # All drivers in one statement: the warehouse round-trip
+        # latency is paid once instead of once per driver, and the
+        # ORDER BY driverName makes each driver's rows contiguous so
+        # they can be split without a second sort.
+        parameters = [
+            StatementParameterListItem(
+                name=f"driver_pat_{i}", value=f"%{d.lower()}%")
+            for i, d in enumerate(driver_names)
+        ]
+        driver_conditions = " OR ".join(
+            f"LOWER(driverName) LIKE :driver_pat_{i}"
+            for i in range(len(driver_names))
+        )
+        query = _DRIVER_PERFORMANCE_BATCH_SQL.format(
+            metric=metric,
+            driver_conditions=driver_conditions,
+        )
+
+        result = client.execute_query(
+            query, parameters=parameters, return_format="numpy")
+
+        if not result.get("success"):
+            return result
+
+        if not result.get("row_count"):
+            return {
+                "success": False,
+                "error": "No data found for the specified drivers.",
+            }
+
+        import numpy as np
+
+        arrays = result["arrays"]
+        driver_col = [str(d) for d in arrays["driverName"].tolist()]
+        season_col = arrays["season"].tolist()
+        values = np.nan_to_num(_float_column(arrays, metric)).tolist()
+
+        chart_service = _get_chart_service()
+        metric_label = metric.replace("_", " ").title()
+
+        charts = []
+        for driver, group in groupby(
+            zip(driver_col, season_col, values), key=itemgetter(0)
+        ):
+            group = list(group)
+            seasons = [g[1] for g in group]
+            driver_values = [g[2] for g in group]
+
+            chart_result = chart_service.create_line_chart(
+                x_values=seasons,
+                y_series={driver: driver_values},
+                title=f"{driver} - {metric_label} by Season",
+                xlabel="Season",
+                ylabel=metric_label,
+            )
+
+            entry = {
+                "driver": driver,
+                "seasons_covered": [seasons[0], seasons[-1]],
+                "chart_type": chart_result.chart_type,
+                "title": chart_result.title,
+                "description": chart_result.description,
+                "data_summary": chart_result.data_summary,
+            }
+
+            save_result = _save_chart_if_requested(
+                chart_result.png_bytes,
+                save_to_file,
+                f"{driver.replace(' ', '_')}_{metric}",
+            )
+            if save_result:
+                entry.update(save_result)
+            else:
+                entry["chart_base64"] = chart_result.chart_base64
+
+            charts.append(entry)
+
+        return {
+            "success": True,
+            "metric": metric,
+            "drivers": [c["driver"] for c in charts],
+            "charts": charts,
+        }
+
+    @mcp.tool()
+    @_cached_chart
     def chart_team_comparison(
         team_names: list[str],
         season: Optional[int] = None,
@@ -156,68 +440,85 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                 "error": "Please provide at least 2 team names to compare.",
             }
 
-        valid_metrics = ["team_total_points", "wins", "podiums", "dnf_count"]
-        if metric not in valid_metrics:
+        if metric not in _TEAM_METRICS:
             return {
                 "success": False,
-                "error": f"Invalid metric. Choose from: {', '.join(valid_metrics)}",
+                "error": f"Invalid metric. Choose from: {', '.join(_TEAM_METRICS)}",
             }
 
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        client = _get_client()
+
+        # One bind per team name, so the statement text only varies
+        # with the number of teams and the season-filter shape.
+        parameters = [
+            StatementParameterListItem(
+                name=f"team_pat_{i}", value=f"%{t.lower()}%")
+            for i, t in enumerate(team_names)
+        ]
         team_conditions = " OR ".join(
-            f"LOWER(teamName) LIKE LOWER('%{t.replace(chr(39), chr(39)*2)}%')"
-            for t in team_names
+            f"LOWER(teamName) LIKE :team_pat_{i}"
+            for i in range(len(team_names))
         )
 
-        season_filter = ""
         if season:
-            season_filter = f"AND season = {int(season)}"
+            season_filter = "AND season = :season"
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
         else:
             season_filter = "AND season >= (SELECT MAX(season) - 4 FROM f1.f1_gold_constructor_season_stats)"
 
-        client = get_databricks_client()
-
-        query = f"""
-        SELECT 
-            season,
-            teamName,
-            {metric}
-        FROM f1.f1_gold_constructor_season_stats
-        WHERE ({team_conditions})
-        {season_filter}
-        ORDER BY season, teamName
-        """
+        query = _TEAM_COMPARISON_SQL.format(
+            metric=metric,
+            team_conditions=team_conditions,
+            season_filter=season_filter,
+        )
 
-        result = client.execute_query(query)
+        result = client.execute_query(
+            query, parameters=parameters, return_format="numpy")
 
         if not result.get("success"):
             return result
 
-        rows = result.get("rows", [])
-        if not rows:
+        if not result.get("row_count"):
             return {
                 "success": False,
                 "error": "No data found for the specified teams.",
             }
 
-        seasons = sorted(set(r.get("season") for r in rows))
-        teams_data = {}
+        import numpy as np
+
+        arrays = result["arrays"]
+        season_col = arrays["season"].tolist()
+        team_col = arrays["teamName"].tolist()
+        metric_col = np.nan_to_num(_float_column(arrays, metric)).tolist()
 
-        for row in rows:
-            team = row.get("teamName")
-            if team not in teams_data:
-                teams_data[team] = {}
-            teams_data[team][row.get("season")] = float(row.get(metric, 0) or 0)
+        # Pivot into a dense (teams, seasons) matrix: one write per row
+        # against precomputed indices, with the zeros for missing
+        # seasons already in place, instead of a dict-of-dicts plus a
+        # per-team dense fill afterwards.
+        # ORDER BY season means first-seen order is already sorted, so
+        # one setdefault scan replaces the set()+sorted() pair.
+        season_idx: dict[Any, int] = {}
+        team_idx: dict[str, int] = {}
+        for row_season, team in zip(season_col, team_col):
+            season_idx.setdefault(row_season, len(season_idx))
+            team_idx.setdefault(team, len(team_idx))
+        seasons = list(season_idx)
 
-        chart_series = {}
-        for team in teams_data:
-            chart_series[team] = [teams_data[team].get(s, 0) for s in seasons]
+        mat = np.zeros((len(team_idx), len(seasons)))
+        for team, row_season, value in zip(team_col, season_col, metric_col):
+            mat[team_idx[team], season_idx[row_season]] = value
 
-        chart_service = get_chart_service()
+        chart_series = {team: mat[i].tolist() for team, i in team_idx.items()}
+
+        chart_service = _get_chart_service()
 
         if len(seasons) == 1:
             chart_result = chart_service.create_bar_chart(
-                labels=list(teams_data.keys()),
-                values=[teams_data[t].get(seasons[0], 0) for t in teams_data],
+                labels=list(team_idx),
+                values=mat[:, 0].tolist(),
                 title=f"Team Comparison - {metric.replace('_', ' ').title()} ({seasons[0]})",
                 xlabel="Team",
                 ylabel=metric.replace("_", " ").title(),
@@ -231,85 +532,88 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                 ylabel=metric.replace("_", " ").title(),
             )
 
-        chart_dict = chart_result.to_dict()
         save_result = _save_chart_if_requested(
-            chart_dict["chart_base64"],
+            chart_result.png_bytes,
             save_to_file,
             filename or f"team_comparison_{metric}",
         )
         
         response = {
             "success": True,
-            "teams": list(teams_data.keys()),
+            "teams": list(team_idx),
             "metric": metric,
             "seasons": seasons,
-            "chart_type": chart_dict["chart_type"],
-            "title": chart_dict["title"],
-            "description": chart_dict["description"],
-            "data_summary": chart_dict["data_summary"],
+            "chart_type": chart_result.chart_type,
+            "title": chart_result.title,
+            "description": chart_result.description,
+            "data_summary": chart_result.data_summary,
         }
         
         if save_result:
             response.update(save_result)
         else:
-            response["chart_base64"] = chart_dict["chart_base64"]
+            response["chart_base64"] = chart_result.chart_base64
         
         return response
 
     @mcp.tool()
+    @_cached_chart
     def chart_pit_stop_analysis(
         season: Optional[int] = None,
         team_name: Optional[str] = None,
         chart_type: str = "box",
     ) -> dict[str, Any]:
-        client = get_databricks_client()
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        client = _get_client()
 
         conditions = ["pit_stop_count > 0", "avg_pit_stop_ms > 0"]
+        parameters = []
         if season:
-            conditions.append(f"season = {int(season)}")
+            conditions.append("season = :season")
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
         if team_name:
-            safe_team = team_name.replace("'", "''")
-            conditions.append(f"LOWER(teamName) LIKE LOWER('%{safe_team}%')")
-
-        where_clause = " AND ".join(conditions)
+            conditions.append("teamName_lower LIKE :team_pat")
+            parameters.append(StatementParameterListItem(
+                name="team_pat", value=f"%{team_name.lower()}%"))
 
-        query = f"""
-        SELECT 
-            teamName,
-            avg_pit_stop_ms,
-            pit_stop_count,
-            race_finish_position
-        FROM f1.f1_gold_race_driver_features
-        WHERE {where_clause}
-        ORDER BY teamName
-        LIMIT 1000
-        """
+        query = _PIT_ANALYSIS_SQL.format(where=" AND ".join(conditions))
 
-        result = client.execute_query(query)
+        result = client.execute_query(
+            query, parameters=parameters, return_format="numpy")
 
         if not result.get("success"):
             return result
 
-        rows = result.get("rows", [])
-        if not rows:
+        row_count = result.get("row_count", 0)
+        if not row_count:
             return {
                 "success": False,
                 "error": "No pit stop data found for the specified criteria.",
             }
 
-        chart_service = get_chart_service()
+        import numpy as np
+
+        arrays = result["arrays"]
+        pit_ms_col = _float_column(arrays, "avg_pit_stop_ms")
+
+        chart_service = _get_chart_service()
 
         if chart_type == "box":
             team_data = {}
-            for row in rows:
-                team = row.get("teamName")
+            for team, pit_ms in zip(arrays["teamName"].tolist(),
+                                    pit_ms_col.tolist()):
                 if team not in team_data:
                     team_data[team] = []
-                pit_ms = row.get("avg_pit_stop_ms")
-                if pit_ms:
-                    team_data[team].append(float(pit_ms))
+                if pit_ms > 0:
+                    team_data[team].append(pit_ms)
 
-            team_data = {k: v for k, v in team_data.items() if len(v) >= 5}
+            team_data = {
+                team: np.asarray(values, dtype=np.float64)
+                for team, values in team_data.items()
+                if len(values) >= 5
+            }
 
             if not team_data:
                 return {
@@ -317,12 +621,20 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                     "error": "Not enough data for box plot analysis.",
                 }
 
-            sorted_teams = sorted(
-                team_data.keys(),
-                key=lambda t: sum(team_data[t]) / len(team_data[t])
-            )[:10]
-
-            team_data = {t: team_data[t] for t in sorted_teams}
+            # Keep the 10 teams with the fastest median stop, matching
+            # the statistic the box plot actually draws; one median per
+            # team plus one argsort replaces the per-comparison Python
+            # mean the old sort key recomputed.
+            team_names = list(team_data)
+            medians = np.fromiter(
+                (np.median(team_data[t]) for t in team_names),
+                dtype=np.float64,
+                count=len(team_names),
+            )
+            team_data = {
+                team_names[i]: team_data[team_names[i]]
+                for i in np.argsort(medians)[:10]
+            }
 
             chart_result = chart_service.create_box_plot(
                 data=team_data,
@@ -331,8 +643,13 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                 ylabel="Average Pit Stop Time (ms)",
             )
         else:
-            x_values = [float(r.get("avg_pit_stop_ms", 0)) for r in rows if r.get("avg_pit_stop_ms")]
-            y_values = [float(r.get("race_finish_position", 0)) for r in rows if r.get("avg_pit_stop_ms")]
+            # One vectorized mask drops the bad rows from both columns
+            # at once; the arrays go to the chart service as-is, since
+            # matplotlib scatters ndarrays without the list round trip.
+            mask = pit_ms_col > 0
+            x_values = pit_ms_col[mask]
+            y_values = np.nan_to_num(
+                _float_column(arrays, "race_finish_position")[mask])
 
             chart_result = chart_service.create_scatter_chart(
                 x_values=x_values,
@@ -347,11 +664,12 @@ def register_visualization_tools(mcp: FastMCP) -> None:
             "success": True,
             "analysis_type": chart_type,
             "season": season_str,
-            "data_points": len(rows),
+            "data_points": row_count,
             **chart_result.to_dict(),
         }
 
     @mcp.tool()
+    @_cached_chart
     def chart_correlation_heatmap(
         features: Optional[list[str]] = None,
         season: Optional[int] = None,
@@ -366,63 +684,66 @@ def register_visualization_tools(mcp: FastMCP) -> None:
         ]
 
         features = features or default_features
-        client = get_databricks_client()
+        from databricks.sdk.service.sql import StatementParameterListItem
 
-        season_filter = f"AND season = {int(season)}" if season else ""
+        from f1_mcp.utils.validators import get_sql_validator
 
-        feature_list = ", ".join(features)
-        query = f"""
-        SELECT {feature_list}
-        FROM f1.f1_gold_race_driver_features
-        WHERE race_finish_position IS NOT NULL
-        {season_filter}
-        LIMIT 5000
-        """
+        client = _get_client()
+
+        parameters = []
+        if season:
+            season_filter = "AND season = :season"
+            parameters.append(StatementParameterListItem(
+                name="season", value=str(int(season)), type="INT"))
+        else:
+            season_filter = ""
+
+        # The whole matrix is computed warehouse-side in one scan:
+        # n*(n-1)/2 corr() aggregates plus a row count come back as a
+        # single row of scalars, instead of shipping up to 5000 raw
+        # rows here to correlate. Feature names sit in identifier
+        # position and cannot be bind parameters, so they are stripped
+        # to column characters first.
+        sanitize = get_sql_validator().sanitize_identifier
+        safe = [sanitize(f) for f in features]
+        n = len(features)
+        aggregates = [
+            f"corr({safe[i]}, {safe[j]}) AS c_{i}_{j}"
+            for i in range(n)
+            for j in range(i + 1, n)
+        ]
+        aggregates.append("COUNT(*) AS sample_size")
+        query = _CORRELATION_SQL.format(
+            aggregates=", ".join(aggregates),
+            season_filter=season_filter,
+        )
 
-        result = client.execute_query(query)
+        result = client.execute_query(query, parameters=parameters)
 
         if not result.get("success"):
             return result
 
         rows = result.get("rows", [])
-        if not rows:
+        sample_size = int(rows[0].get("sample_size") or 0) if rows else 0
+        if not sample_size:
             return {
                 "success": False,
                 "error": "No data found for correlation analysis.",
             }
 
-        import numpy as np
-
-        data = {f: [] for f in features}
-        for row in rows:
-            valid_row = True
-            for f in features:
-                val = row.get(f)
-                if val is None:
-                    valid_row = False
-                    break
-            if valid_row:
-                for f in features:
-                    data[f].append(float(row.get(f, 0)))
-
-        if not data[features[0]]:
-            return {
-                "success": False,
-                "error": "Not enough valid data for correlation analysis.",
-            }
-
-        n = len(features)
-        corr_matrix = [[0.0] * n for _ in range(n)]
-
-        for i, f1 in enumerate(features):
-            for j, f2 in enumerate(features):
-                if len(data[f1]) > 1:
-                    corr = np.corrcoef(data[f1], data[f2])[0, 1]
-                    corr_matrix[i][j] = corr if not np.isnan(corr) else 0.0
-                else:
-                    corr_matrix[i][j] = 1.0 if i == j else 0.0
+        # Mirror the upper triangle across the diagonal; constant
+        # columns come back as NULL and render as zero correlation.
+        row = rows[0]
+        corr_matrix = [
+            [1.0 if i == j else 0.0 for j in range(n)] for i in range(n)
+        ]
+        for i in range(n):
+            for j in range(i + 1, n):
+                value = row.get(f"c_{i}_{j}")
+                corr = float(value) if value is not None else 0.0
+                corr_matrix[i][j] = corr_matrix[j][i] = corr
 
-        chart_service = get_chart_service()
+        chart_service = _get_chart_service()
 
         short_names = [f.replace("_", " ").replace("position", "pos")[:15] for f in features]
 
@@ -436,12 +757,13 @@ def register_visualization_tools(mcp: FastMCP) -> None:
         return {
             "success": True,
             "features": features,
-            "data_points": len(data[features[0]]),
+            "data_points": sample_size,
             "season": season or "all",
             **chart_result.to_dict(),
         }
 
     @mcp.tool()
+    @_cached_chart
     def chart_season_standings(
         season: int,
         top_n: int = 10,
@@ -449,52 +771,47 @@ def register_visualization_tools(mcp: FastMCP) -> None:
         save_to_file: bool = True,
         filename: Optional[str] = None,
     ) -> dict[str, Any]:
-        client = get_databricks_client()
+        from databricks.sdk.service.sql import StatementParameterListItem
+
+        client = _get_client()
         top_n = min(top_n, 20)
 
         if entity == "drivers":
-            query = f"""
-            SELECT 
-                driverName as name,
-                total_points as points,
-                wins,
-                final_champ_position as position
-            FROM f1.f1_gold_driver_season_stats
-            WHERE season = {int(season)}
-            ORDER BY total_points DESC
-            LIMIT {top_n}
-            """
+            query = _DRIVER_STANDINGS_SQL
             title = f"{season} Driver Championship Standings"
         else:
-            query = f"""
-            SELECT 
-                teamName as name,
-                team_total_points as points,
-                wins,
-                final_cons_position as position
-            FROM f1.f1_gold_constructor_season_stats
-            WHERE season = {int(season)}
-            ORDER BY team_total_points DESC
-            LIMIT {top_n}
-            """
+            query = _CONSTRUCTOR_STANDINGS_SQL
             title = f"{season} Constructor Championship Standings"
 
-        result = client.execute_query(query)
+        result = client.execute_query(
+            query,
+            parameters=[
+                StatementParameterListItem(
+                    name="season", value=str(int(season)), type="INT"),
+                StatementParameterListItem(
+                    name="limit", value=str(int(top_n)), type="INT"),
+            ],
+            return_format="numpy",
+        )
 
         if not result.get("success"):
             return result
 
-        rows = result.get("rows", [])
-        if not rows:
+        if not result.get("row_count"):
             return {
                 "success": False,
                 "error": f"No data found for season {season}.",
             }
 
-        names = [r.get("name", "") for r in rows]
-        points = [float(r.get("points", 0) or 0) for r in rows]
+        import numpy as np
+
+        arrays = result["arrays"]
+        names = [str(n) for n in arrays["name"].tolist()]
+        points_raw = arrays["points"].tolist()
+        wins = arrays["wins"].tolist()
+        points = np.nan_to_num(_float_column(arrays, "points")).tolist()
 
-        chart_service = get_chart_service()
+        chart_service = _get_chart_service()
 
         chart_result = chart_service.create_bar_chart(
             labels=names,
@@ -505,9 +822,8 @@ def register_visualization_tools(mcp: FastMCP) -> None:
             horizontal=True,
         )
 
-        chart_dict = chart_result.to_dict()
         save_result = _save_chart_if_requested(
-            chart_dict["chart_base64"],
+            chart_result.png_bytes,
             save_to_file,
             filename or f"{season}_{entity}_standings",
         )
@@ -517,23 +833,24 @@ def register_visualization_tools(mcp: FastMCP) -> None:
             "season": season,
             "entity": entity,
             "standings": [
-                {"name": r.get("name"), "points": r.get("points"), "wins": r.get("wins")}
-                for r in rows
+                {"name": n, "points": p, "wins": w}
+                for n, p, w in zip(names, points_raw, wins)
             ],
-            "chart_type": chart_dict["chart_type"],
-            "title": chart_dict["title"],
-            "description": chart_dict["description"],
-            "data_summary": chart_dict["data_summary"],
+            "chart_type": chart_result.chart_type,
+            "title": chart_result.title,
+            "description": chart_result.description,
+            "data_summary": chart_result.data_summary,
         }
         
         if save_result:
             response.update(save_result)
         else:
-            response["chart_base64"] = chart_dict["chart_base64"]
+            response["chart_base64"] = chart_result.chart_base64
         
         return response
 
     @mcp.tool()
+    @_cached_chart
     def chart_custom(
         query: str,
         x_column: str,
@@ -553,7 +870,7 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                 "error": validation.error_message,
             }
 
-        client = get_databricks_client()
+        client = _get_client()
         result = client.execute_query(query, max_rows=500)
 
         if not result.get("success"):
@@ -578,27 +895,33 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                 "error": f"Column '{y_column}' not found. Available: {', '.join(columns)}",
             }
 
-        chart_service = get_chart_service()
+        chart_service = _get_chart_service()
         auto_title = title or f"{y_column} by {x_column}"
 
         if group_column and group_column in columns:
-            groups = {}
-            x_values = []
-
+            import numpy as np
+
+            # Same dense pivot as chart_team_comparison: index maps
+            # built in one scan, then one matrix write per row. All
+            # three columns were just checked against the result, so
+            # the C-level itemgetter replaces three dict.get calls per
+            # row.
+            get_fields = itemgetter(x_column, group_column, y_column)
+            x_idx: dict[Any, int] = {}
+            group_idx: dict[Any, int] = {}
+            cells = []
             for row in rows:
-                x_val = row.get(x_column)
-                if x_val not in x_values:
-                    x_values.append(x_val)
-
-                group = row.get(group_column, "Default")
-                if group not in groups:
-                    groups[group] = {}
-                groups[group][x_val] = float(row.get(y_column, 0) or 0)
-
-            series = {
-                g: [groups[g].get(x, 0) for x in x_values]
-                for g in groups
-            }
+                x_val, group, y_val = get_fields(row)
+                xi = x_idx.setdefault(x_val, len(x_idx))
+                gi = group_idx.setdefault(group, len(group_idx))
+                cells.append((gi, xi, float(y_val or 0)))
+
+            mat = np.zeros((len(group_idx), len(x_idx)))
+            for gi, xi, value in cells:
+                mat[gi, xi] = value
+
+            x_values = list(x_idx)
+            series = {g: mat[i].tolist() for g, i in group_idx.items()}
 
             chart_result = chart_service.create_line_chart(
                 x_values=x_values,
@@ -609,8 +932,9 @@ def register_visualization_tools(mcp: FastMCP) -> None:
             )
         else:
             # Single series chart
-            x_values = [str(r.get(x_column, "")) for r in rows]
-            y_values = [float(r.get(y_column, 0) or 0) for r in rows]
+            pairs = list(map(itemgetter(x_column, y_column), rows))
+            x_values = [str(x) for x, _ in pairs]
+            y_values = [float(y or 0) for _, y in pairs]
 
             if chart_type == "line":
                 chart_result = chart_service.create_line_chart(
@@ -621,9 +945,18 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                     ylabel=y_column,
                 )
             elif chart_type == "scatter":
+                import numpy as np
+
+                # Convert the whole column in one C pass; if any value
+                # is non-numeric, fall back to positional indices for
+                # the entire axis rather than mixing the two per row.
+                try:
+                    x_floats = np.asarray(x_values, dtype=np.float64)
+                except ValueError:
+                    x_floats = np.arange(len(x_values), dtype=np.float64)
+
                 chart_result = chart_service.create_scatter_chart(
-                    x_values=[float(v) if v.replace(".", "").replace("-", "").isdigit() else i 
-                             for i, v in enumerate(x_values)],
+                    x_values=x_floats.tolist(),
                     y_values=y_values,
                     title=auto_title,
                     xlabel=x_column,
@@ -669,17 +1002,14 @@ def register_visualization_tools(mcp: FastMCP) -> None:
             out_path.mkdir(parents=True, exist_ok=True)
 
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"f1_chart_{timestamp}"
+                filename = f"f1_chart_{time.strftime(_TS_FMT)}"
 
             if not filename.endswith(".png"):
                 filename = f"{filename}.png"
 
             file_path = out_path / filename
 
-            image_data = base64.b64decode(chart_base64)
-            with open(file_path, "wb") as f:
-                f.write(image_data)
+            _write_image(file_path, base64.b64decode(chart_base64, validate=False))
 
             return {
                 "success": True,
@@ -707,12 +1037,19 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                     "error": f"File not found: {file_path}",
                 }
 
-            if sys.platform == "darwin":  # macOS
-                subprocess.run(["open", str(path)], check=True)
-            elif sys.platform == "win32":  # Windows
-                subprocess.run(["start", "", str(path)], shell=True, check=True)
-            else:  # Linux
-                subprocess.run(["xdg-open", str(path)], check=True)
+            # Fire and forget: don't block the tool on the viewer (or
+            # on xdg-open's GUI handshake); launch failures still
+            # surface through the except below.
+            if sys.platform == "win32":
+                os.startfile(str(path))
+            else:
+                launcher = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen(
+                    [launcher, str(path)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
 
             return {
                 "success": True,
@@ -740,15 +1077,26 @@ def register_visualization_tools(mcp: FastMCP) -> None:
                     "message": "No charts directory found. Generate and save a chart first.",
                 }
 
-            charts = []
-            for f in sorted(out_path.glob("*.png"), key=os.path.getmtime, reverse=True):
-                stat = f.stat()
-                charts.append({
+            # One stat() per entry, shared between the mtime sort and
+            # the listing; iterdir with a suffix check skips glob's
+            # fnmatch pass.
+            entries = [
+                (f, f.stat())
+                for f in out_path.iterdir()
+                if f.name.endswith(".png")
+            ]
+            entries.sort(key=lambda e: e[1].st_mtime, reverse=True)
+
+            charts = [
+                {
                     "filename": f.name,
                     "path": str(f),
                     "size_kb": round(stat.st_size / 1024, 1),
-                    "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                })
+                    "created": time.strftime(
+                        _ISO_FMT, time.localtime(stat.st_mtime)),
+                }
+                for f, stat in entries
+            ]
 
             return {
                 "success": True,
@@ -2,9 +2,12 @@
 
 from f1_mcp.utils.validators import SQLValidator
 from f1_mcp.utils.formatters import ResultFormatter
+from f1_mcp.utils.ttl_cache import ttl_cache, clear_ttl_caches
 
 __all__ = [
     "SQLValidator",
     "ResultFormatter",
+    "ttl_cache",
+    "clear_ttl_caches",
 ]
 
@@ -1,8 +1,106 @@
 """Result formatting utilities for MCP tool responses."""
 
+from functools import lru_cache
 from typing import Any, Optional
+import io
 import json
 
+# orjson serializes in C without touching each cell from the
+# interpreter; fall back to stdlib json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional binary output mode; see to_msgpack.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+@lru_cache(maxsize=256)
+def _compile_row_formatter(columns: tuple[str, ...]):
+    """Compile a row-dict -> "col: value | ..." function for one shape.
+
+    The generated body is straight-line — one dict lookup and one
+    concatenation per column, no per-row loop over the column list.
+    Each distinct column tuple pays the exec once; results repeat the
+    same handful of shapes, so the cache effectively never evicts.
+    Labels and keys are embedded via repr, so any column name is safe.
+    """
+    exprs = []
+    for i, col in enumerate(columns):
+        prefix = ("" if i == 0 else " | ") + f"{col}: "
+        exprs.append(f"{prefix!r} + fmt(g({col!r}))")
+    src = (
+        "def _row_fn(row, fmt):\n"
+        "    g = row.get\n"
+        "    return " + " + ".join(exprs)
+    )
+    namespace: dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace["_row_fn"]
+
+
+@lru_cache(maxsize=256)
+def _compile_positional_formatter(columns: tuple[str, ...]):
+    """Like _compile_row_formatter, but for positional value tuples.
+
+    Used by the columnar result path: cells are read by index instead
+    of hashed dict lookups.
+    """
+    exprs = []
+    for i, col in enumerate(columns):
+        prefix = ("" if i == 0 else " | ") + f"{col}: "
+        exprs.append(f"{prefix!r} + fmt(v[{i}])")
+    src = (
+        "def _pos_fn(v, fmt):\n"
+        "    return " + " + ".join(exprs)
+    )
+    namespace: dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace["_pos_fn"]
+
+
+@lru_cache(maxsize=64)
+def _md_separator(width: int) -> str:
+    """Markdown header/body separator row, cached per column count."""
+    return "| " + " | ".join(["---"] * width) + " |"
+
+
+@lru_cache(maxsize=64)
+def _compile_cell_formatter(width: int):
+    """Compile a value-tuple -> "| v0 | v1 |" markdown row function."""
+    cells = " + \" | \" + ".join(f"fmt(v[{i}])" for i in range(width))
+    src = (
+        "def _cells_fn(v, fmt):\n"
+        '    return "| " + ' + cells + ' + " |"'
+    )
+    namespace: dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace["_cells_fn"]
+
+
+@lru_cache(maxsize=4096)
+def _format_float(value: float) -> str:
+    """Cached two-decimal rendering for repeated float cells.
+
+    Points, positions and similar low-cardinality numeric columns
+    repeat the same handful of values thousands of times per result;
+    the cache turns the format() call into a dict hit. Bounded, so
+    high-cardinality measures just behave like the uncached path.
+    """
+    return format(value, ".2f")
+
+
+def _dumps(obj: Any, indent: int = 0) -> str:
+    """Serialize through orjson when present, stdlib json otherwise."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=str).decode()
+    return json.dumps(obj, indent=indent or None, default=str)
+
 
 class ResultFormatter:
 
@@ -11,39 +109,65 @@ class ResultFormatter:
         result: dict[str, Any],
         max_display_rows: int = 50,
     ) -> str:
-        if not result.get("success"):
-            error = result.get("error", "Unknown error")
-            return f"Query failed: {error}"
+        # One bound result.get serves every header field instead of a
+        # fresh attribute lookup per key, with the error path decided
+        # before anything else is touched.
+        g = result.get
+        if not g("success"):
+            return f"Query failed: {g('error', 'Unknown error')}"
 
-        columns = result.get("columns", [])
-        rows = result.get("rows", [])
-        row_count = result.get("row_count", len(rows))
+        columns = g("columns", [])
+        rows = g("rows", [])
+        row_count = g("row_count", len(rows))
 
         if not columns:
             return "Query returned no columns."
 
+        # Columnar results (return_format="columns") are rendered
+        # positionally from the value lists: no per-row dicts are
+        # built and no per-cell hash lookups happen.
+        data = g("data")
+        if not rows and data:
+            value_lists = [data.get(col, []) for col in columns]
+            if not min(map(len, value_lists), default=0):
+                return "Query returned no rows."
+            row_count = g("row_count", len(value_lists[0]))
+
+            buf = io.StringIO()
+            w = buf.write
+            w(f"Query returned {row_count} row(s)\n\nColumns: {', '.join(columns)}\n")
+
+            fmt = ResultFormatter._format_value
+            format_row = _compile_positional_formatter(tuple(columns))
+            for i, values in enumerate(zip(*value_lists), 1):
+                if i > max_display_rows:
+                    break
+                w(f"\n[{i}] " + format_row(values, fmt))
+
+            if row_count > max_display_rows:
+                w(f"\n... and {row_count - max_display_rows} more rows")
+
+            return buf.getvalue()
+
         if not rows:
             return "Query returned no rows."
 
-        lines = [
-            f"Query returned {row_count} row(s)",
-            "",
-            "Columns: " + ", ".join(columns),
-            "",
-        ]
+        # One growable buffer instead of a list of line strings plus a
+        # final join; each row is written as soon as it is formatted.
+        buf = io.StringIO()
+        w = buf.write
+        w(f"Query returned {row_count} row(s)\n\nColumns: {', '.join(columns)}\n")
 
+        fmt = ResultFormatter._format_value
+        format_row = _compile_row_formatter(tuple(columns))
         display_rows = rows[:max_display_rows]
         for i, row in enumerate(display_rows, 1):
-            row_str = " | ".join(
-                f"{col}: {ResultFormatter._format_value(row.get(col))}"
-                for col in columns
-            )
-            lines.append(f"[{i}] {row_str}")
+            w(f"\n[{i}] " + format_row(row, fmt))
 
         if row_count > max_display_rows:
-            lines.append(f"... and {row_count - max_display_rows} more rows")
+            w(f"\n... and {row_count - max_display_rows} more rows")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     @staticmethod
     def format_table_list(result: dict[str, Any]) -> str:
@@ -54,21 +178,22 @@ class ResultFormatter:
         if not rows:
             return "No tables found."
 
-        lines = [f"Found {len(rows)} table(s):", ""]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"Found {len(rows)} table(s):\n")
 
         for row in rows:
             table_name = row.get("table_name", "Unknown")
             table_type = row.get("table_type", "")
             comment = row.get("comment", "")
 
-            line = f"  - {table_name}"
+            w(f"\n  - {table_name}")
             if table_type:
-                line += f" ({table_type})"
+                w(f" ({table_type})")
             if comment:
-                line += f": {comment}"
-            lines.append(line)
+                w(f": {comment}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     @staticmethod
     def format_table_schema(table_name: str, result: dict[str, Any]) -> str:
@@ -79,7 +204,9 @@ class ResultFormatter:
         if not rows:
             return f"No columns found for table '{table_name}'."
 
-        lines = [f"Schema for '{table_name}':", ""]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"Schema for '{table_name}':\n")
 
         for row in rows:
             col_name = row.get("column_name", "Unknown")
@@ -88,58 +215,303 @@ class ResultFormatter:
             comment = row.get("comment", "")
 
             null_str = "NULL" if nullable == "YES" else "NOT NULL"
-            line = f"  - {col_name}: {data_type} ({null_str})"
+            w(f"\n  - {col_name}: {data_type} ({null_str})")
             if comment:
-                line += f" -- {comment}"
-            lines.append(line)
+                w(f" -- {comment}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     @staticmethod
     def format_as_markdown_table(
         result: dict[str, Any],
         max_rows: int = 20,
     ) -> str:
-        if not result.get("success"):
-            return f"**Error:** {result.get('error')}"
+        g = result.get
+        if not g("success"):
+            return f"**Error:** {g('error')}"
 
-        columns = result.get("columns", [])
-        rows = result.get("rows", [])
+        columns = g("columns", [])
+        rows = g("rows", [])
+
+        if not columns:
+            return "*No data to display*"
+
+        # Columnar results (return_format="columns") are rendered
+        # straight from the value lists — no per-row dicts are built.
+        data = g("data")
+        if not rows and data:
+            row_iter = zip(*(data.get(col, []) for col in columns))
+            total = g("row_count", 0)
+        elif rows:
+            row_iter = (
+                tuple(row.get(col) for col in columns) for row in rows
+            )
+            total = len(rows)
+        else:
+            return "*No data to display*"
 
-        if not columns or not rows:
+        fmt = ResultFormatter._format_value
+        format_cells = _compile_cell_formatter(len(columns))
+        buf = io.StringIO()
+        w = buf.write
+        shown = 0
+        for i, values in enumerate(row_iter):
+            if i >= max_rows:
+                break
+            if not shown:
+                # Header work happens only once a row actually exists;
+                # the separator line is cached per column count.
+                w("| " + " | ".join(columns) + " |\n")
+                w(_md_separator(len(columns)))
+            w("\n" + format_cells(values, fmt))
+            shown += 1
+
+        if not shown:
             return "*No data to display*"
 
-        header = "| " + " | ".join(columns) + " |"
-        separator = "| " + " | ".join(["---"] * len(columns)) + " |"
+        if total > max_rows:
+            w(f"\n\n*... {total - max_rows} more rows*")
 
-        data_rows = []
-        for row in rows[:max_rows]:
-            values = [
-                ResultFormatter._format_value(row.get(col))
-                for col in columns
-            ]
-            data_rows.append("| " + " | ".join(values) + " |")
+        return buf.getvalue()
 
-        lines = [header, separator] + data_rows
+    @staticmethod
+    def iter_query_result(
+        result: dict[str, Any],
+        max_display_rows: int = 50,
+    ):
+        """Yield format_query_result output one line at a time.
+
+        Streaming counterpart for large already-materialized results:
+        only the current line exists at any point, so peak memory is
+        O(columns) instead of O(rows). Joining the lines with a
+        newline reproduces format_query_result exactly.
+        """
+        g = result.get
+        if not g("success"):
+            yield f"Query failed: {g('error', 'Unknown error')}"
+            return
+
+        columns = g("columns", [])
+        rows = g("rows", [])
+        row_count = g("row_count", len(rows))
 
-        if len(rows) > max_rows:
-            lines.append(f"\n*... {len(rows) - max_rows} more rows*")
+        if not columns:
+            yield "Query returned no columns."
+            return
+
+        data = g("data")
+        if not rows and data:
+            value_lists = [data.get(col, []) for col in columns]
+            if not min(map(len, value_lists), default=0):
+                yield "Query returned no rows."
+                return
+            row_count = g("row_count", len(value_lists[0]))
+
+            yield f"Query returned {row_count} row(s)"
+            yield ""
+            yield "Columns: " + ", ".join(columns)
+            yield ""
+
+            fmt = ResultFormatter._format_value
+            format_row = _compile_positional_formatter(tuple(columns))
+            for i, values in enumerate(zip(*value_lists), 1):
+                if i > max_display_rows:
+                    break
+                yield f"[{i}] " + format_row(values, fmt)
+
+            if row_count > max_display_rows:
+                yield f"... and {row_count - max_display_rows} more rows"
+            return
 
-        return "\n".join(lines)
+        if not rows:
+            yield "Query returned no rows."
+            return
+
+        yield f"Query returned {row_count} row(s)"
+        yield ""
+        yield "Columns: " + ", ".join(columns)
+        yield ""
+
+        fmt = ResultFormatter._format_value
+        format_row = _compile_row_formatter(tuple(columns))
+        for i, row in enumerate(rows, 1):
+            if i > max_display_rows:
+                break
+            yield f"[{i}] " + format_row(row, fmt)
+
+        if row_count > max_display_rows:
+            yield f"... and {row_count - max_display_rows} more rows"
+
+    @staticmethod
+    def iter_markdown_table(
+        result: dict[str, Any],
+        max_rows: int = 20,
+    ):
+        """Yield format_as_markdown_table output one line at a time.
+
+        Same contract as iter_query_result: joining with a newline
+        reproduces the block formatter byte for byte.
+        """
+        g = result.get
+        if not g("success"):
+            yield f"**Error:** {g('error')}"
+            return
+
+        columns = g("columns", [])
+        rows = g("rows", [])
+
+        if not columns:
+            yield "*No data to display*"
+            return
+
+        data = g("data")
+        if not rows and data:
+            row_iter = zip(*(data.get(col, []) for col in columns))
+            total = g("row_count", 0)
+        elif rows:
+            row_iter = (
+                tuple(row.get(col) for col in columns) for row in rows
+            )
+            total = len(rows)
+        else:
+            yield "*No data to display*"
+            return
+
+        fmt = ResultFormatter._format_value
+        format_cells = _compile_cell_formatter(len(columns))
+        shown = 0
+        for i, values in enumerate(row_iter):
+            if i >= max_rows:
+                break
+            if not shown:
+                yield "| " + " | ".join(columns) + " |"
+                yield _md_separator(len(columns))
+            yield format_cells(values, fmt)
+            shown += 1
+
+        if not shown:
+            yield "*No data to display*"
+            return
+
+        if total > max_rows:
+            yield ""
+            yield f"*... {total - max_rows} more rows*"
+
+    @staticmethod
+    def format_markdown_stream(
+        batches: Any,
+        max_rows: int = 20,
+    ) -> tuple[str, int]:
+        """Markdown table from an iterator of (columns, rows) batches.
+
+        Consumes the batches one at a time so only the displayed rows
+        are ever held in memory. Returns the rendered table and the
+        total number of rows seen.
+        """
+        # Rows are written straight into one growable buffer as they
+        # stream past; no per-line list is kept and there is no final
+        # join pass over the fragments.
+        fmt = ResultFormatter._format_value
+        buf = None
+        total = 0
+        for columns, rows in batches:
+            if buf is None:
+                buf = io.StringIO()
+                w = buf.write
+                w("| " + " | ".join(columns) + " |\n")
+                w(_md_separator(len(columns)))
+            for row in rows:
+                total += 1
+                if total <= max_rows:
+                    values = [fmt(row.get(col)) for col in columns]
+                    w("\n| " + " | ".join(values) + " |")
+
+        if buf is None or total == 0:
+            return "*No data to display*", total
+
+        if total > max_rows:
+            w(f"\n\n*... {total - max_rows} more rows*")
+
+        return buf.getvalue(), total
+
+    @staticmethod
+    def format_text_stream(
+        batches: Any,
+        max_display_rows: int = 50,
+    ) -> tuple[str, int]:
+        """Plain-text rendering from an iterator of (columns, rows) batches.
+
+        Streaming counterpart of format_query_result; returns the text
+        and the total number of rows seen.
+        """
+        # Same single-buffer strategy as format_markdown_stream; the
+        # row-count header is prepended at the end since the total is
+        # only known once the batches are exhausted.
+        fmt = ResultFormatter._format_value
+        buf = None
+        format_row = None
+        total = 0
+        for columns, rows in batches:
+            if buf is None:
+                buf = io.StringIO()
+                w = buf.write
+                w("Columns: " + ", ".join(columns) + "\n")
+                format_row = _compile_row_formatter(tuple(columns))
+            for row in rows:
+                total += 1
+                if total <= max_display_rows:
+                    w(f"\n[{total}] " + format_row(row, fmt))
+
+        if buf is None:
+            return "Query returned no columns.", 0
+        if total == 0:
+            return "Query returned no rows.", 0
+
+        if total > max_display_rows:
+            w(f"\n... and {total - max_display_rows} more rows")
+
+        return f"Query returned {total} row(s)\n\n" + buf.getvalue(), total
 
     @staticmethod
     def _format_value(value: Any) -> str:
+        # Exact-type dispatch ordered by cell frequency (REST results
+        # arrive mostly as strings): a type identity test skips
+        # isinstance's subclass walk, and format() skips the f-string
+        # spec parse. Subclasses (numpy floats, bool) fall through to
+        # the general checks below and format as before.
+        t = type(value)
+        if t is str:
+            return value
+        if t is int:
+            return str(value)
+        if t is float:
+            return _format_float(value)
         if value is None:
             return "NULL"
         if isinstance(value, float):
-            return f"{value:.2f}"
+            return _format_float(float(value))
         if isinstance(value, (list, dict)):
-            return json.dumps(value)
+            return _dumps(value)
         return str(value)
 
     @staticmethod
     def to_json(result: dict[str, Any], indent: int = 2) -> str:
-        return json.dumps(result, indent=indent, default=str)
+        return _dumps(result, indent)
+
+    @staticmethod
+    def to_msgpack(result: dict[str, Any]) -> bytes:
+        """Encode a tool result as MessagePack bytes.
+
+        Noticeably smaller than JSON for wide results and cheaper for
+        the caller to decode, but both sides must agree on the wire
+        format — to_json stays the default. Requires the optional
+        msgpack dependency.
+        """
+        if msgpack is None:
+            raise RuntimeError(
+                "msgpack is not installed; binary results are unavailable."
+            )
+        return msgpack.packb(result, use_bin_type=True, default=str)
 
     @staticmethod
     def extract_numeric_columns(
@@ -151,15 +523,27 @@ class ResultFormatter:
         rows = result["rows"]
         columns = result.get("columns", [])
 
+        # A float() cast probes numeric strings without the throwaway
+        # copies str.replace built (and without misreading "1.2.3" or
+        # "--5" as numeric). The first few rows are sampled so a NULL
+        # in row 0 no longer hides a numeric column.
         numeric_cols = []
-        if rows:
-            first_row = rows[0]
-            for col in columns:
-                val = first_row.get(col)
-                if isinstance(val, (int, float)) or (
-                    isinstance(val, str) and val.replace(".", "").replace("-", "").isdigit()
-                ):
+        sample = rows[:5]
+        for col in columns:
+            for row in sample:
+                val = row.get(col)
+                if val is None:
+                    continue
+                if isinstance(val, (int, float)):
+                    numeric_cols.append(col)
+                    break
+                if isinstance(val, str):
+                    try:
+                        float(val)
+                    except ValueError:
+                        break
                     numeric_cols.append(col)
+                break
 
         return numeric_cols, rows
 
@@ -0,0 +1,41 @@
+"""Time-bounded memoization built on functools.lru_cache."""
+
+import time
+from functools import lru_cache, wraps
+from typing import Any, Callable
+
+# Wrappers created by ttl_cache, so stale entries can be dropped centrally.
+_registered_caches: list[Callable[[], None]] = []
+
+
+def ttl_cache(maxsize: int = 128, ttl_seconds: float = 300.0):
+    """Memoize a function, expiring entries after roughly ttl_seconds.
+
+    Entries are keyed by the call arguments plus a monotonic-clock
+    bucket, so a result is reused within its TTL window and silently
+    recomputed in the next one. Arguments must be hashable.
+    """
+
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def cached(_ttl_bucket: int, *args: Any, **kwargs: Any):
+            return func(*args, **kwargs)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any):
+            bucket = int(time.monotonic() // ttl_seconds)
+            return cached(bucket, *args, **kwargs)
+
+        wrapper.cache_clear = cached.cache_clear
+        wrapper.cache_info = cached.cache_info
+        _registered_caches.append(cached.cache_clear)
+        return wrapper
+
+    return decorator
+
+
+def clear_ttl_caches() -> int:
+    """Drop every ttl_cache entry; returns how many caches were cleared."""
+    for cache_clear in _registered_caches:
+        cache_clear()
+    return len(_registered_caches)